@@ -49,4 +49,7 @@ def create_cache_manager(config: CacheConfig) -> CacheManager:
         Cache manager instance
     """
     backend = create_cache_backend(config)
-    return CacheManager(cache=backend)
+    return CacheManager(
+        cache=backend,
+        cleanup_interval_seconds=config.cleanup_interval_seconds,
+    )
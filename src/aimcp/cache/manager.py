@@ -1,23 +1,55 @@
 """Cache manager with high-level operations."""
 
 import asyncio
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+import functools
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass, field
 from typing import Any
 
 from ..config.models import GitLabRepository
-from ..utils.logging import get_logger
-from .models import CacheKey, CacheStats, RepositoryCacheKey
+from ..utils.logging import get_logger, is_debug_enabled
+from .models import CacheKey, CacheStats
 from .protocol import CacheProtocol
 
 logger = get_logger("cache.manager")
 
+# Number of keys fetched or deleted per batched backend call
+_KEY_BATCH_SIZE = 500
+
+# Seconds a statistics snapshot is served before the backend is asked again
+_STATS_MAX_AGE_SECONDS = 1.0
+
+
+@functools.lru_cache(maxsize=4096)
+def _rule_file_key(prefix: str, file_path: str) -> CacheKey:
+    """Build the digest cache key for a repository file.
+
+    Memoized on the (prefix, path) tuple, which hashes from the already
+    cached hashes of its strings. Repeated lookups of a file get back the
+    same key object, whose own hash is cached too.
+
+    Args:
+        prefix: Repository cache key prefix
+        file_path: File path within repository
+
+    Returns:
+        Cache key
+    """
+    raw_key = prefix + file_path
+    return hashlib.blake2b(raw_key.encode("utf-8"), digest_size=16).hexdigest()
+
 
 @dataclass(slots=True)
 class CacheManager:
     """High-level cache manager."""
 
     cache: CacheProtocol
+    cleanup_interval_seconds: int = 300
+    _background_tasks: set[asyncio.Task[None]] = field(default_factory=set)
+    _inflight: dict[CacheKey, asyncio.Task[str]] = field(default_factory=dict)
+    _stats_snapshot: tuple[float, CacheStats] | None = None
     _cleanup_task: asyncio.Task[None] | None = None
 
     def __post_init__(self) -> None:
@@ -25,19 +57,24 @@ class CacheManager:
         logger.info("Cache manager initialized")
 
     async def start(self) -> None:
-        """Start cache manager and background tasks."""
+        """Start cache manager and background tasks.
+
+        Starting an already started manager is a no-op.
+        """
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+
         # Start cleanup task
-        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self._cleanup_task = self._create_background_task(self._cleanup_loop())
         logger.info("Cache manager started")
 
     async def stop(self) -> None:
         """Stop cache manager and cleanup."""
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._cleanup_task = None
 
         await self.cache.close()
         logger.info("Cache manager stopped")
@@ -51,11 +88,32 @@ class CacheManager:
         """Async context manager exit."""
         await self.stop()
 
+    def _create_background_task(
+        self, coro: Coroutine[Any, Any, None]
+    ) -> asyncio.Task[None]:
+        """Schedule a coroutine and keep a strong reference until it finishes.
+
+        Args:
+            coro: Coroutine to run in the background
+
+        Returns:
+            Scheduled task
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     async def _cleanup_loop(self) -> None:
         """Background cleanup loop."""
+        loop = asyncio.get_running_loop()
+        next_wake = loop.time() + self.cleanup_interval_seconds
+
         while True:
             try:
-                await asyncio.sleep(300)  # Cleanup every 5 minutes
+                # Sleep until the scheduled tick so cleanup time does not drift
+                await asyncio.sleep(max(0.0, next_wake - loop.time()))
+                next_wake = loop.time() + self.cleanup_interval_seconds
 
                 cleaned_count = await self.cache.cleanup_expired()
                 if cleaned_count > 0:
@@ -81,12 +139,102 @@ class CacheManager:
         Returns:
             Cache key
         """
-        key = RepositoryCacheKey(
-            repository_url=repository.url,
-            branch=repository.branch,
-            file_path=file_path,
+        # Fixed-size digest; file paths are recovered from the repository index
+        return _rule_file_key(repository.cache_key_prefix, file_path)
+
+    def _make_index_key(self, repository: GitLabRepository) -> CacheKey:
+        """Create key of the set indexing a repository's cached files.
+
+        Args:
+            repository: Repository configuration
+
+        Returns:
+            Index set key
+        """
+        return "index:" + repository.cache_key_prefix
+
+    def _make_tool_result_key(
+        self, repository: GitLabRepository, tool_name: str
+    ) -> CacheKey:
+        """Create cache key for a memoized tool result.
+
+        Args:
+            repository: Repository configuration
+            tool_name: Resolved tool name
+
+        Returns:
+            Cache key
+        """
+        return "tool-result:" + _rule_file_key(repository.cache_key_prefix, tool_name)
+
+    def _make_tool_result_index_key(self, repository: GitLabRepository) -> CacheKey:
+        """Create key of the set indexing a repository's memoized tool results.
+
+        Args:
+            repository: Repository configuration
+
+        Returns:
+            Index set key
+        """
+        return "tool-results:" + repository.cache_key_prefix
+
+    async def get_tool_result(
+        self,
+        repository: GitLabRepository,
+        tool_name: str,
+    ) -> dict[str, Any] | None:
+        """Get a memoized tool result.
+
+        Args:
+            repository: Repository configuration
+            tool_name: Resolved tool name
+
+        Returns:
+            Tool result or None if not cached
+        """
+        data = await self.cache.get(self._make_tool_result_key(repository, tool_name))
+        return data if isinstance(data, dict) else None
+
+    async def set_tool_result(
+        self,
+        repository: GitLabRepository,
+        tool_name: str,
+        result: dict[str, Any],
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """Memoize a tool result; invalidating the repository drops it.
+
+        Args:
+            repository: Repository configuration
+            tool_name: Resolved tool name
+            result: Tool result to cache
+            ttl_seconds: TTL override (optional)
+        """
+        key = self._make_tool_result_key(repository, tool_name)
+        await self.cache.set(key, result, ttl_seconds)
+        await self.cache.sadd_entries(
+            self._make_tool_result_index_key(repository), {key: tool_name}
+        )
+
+    async def _invalidate_tool_results(self, repository: GitLabRepository) -> int:
+        """Drop all memoized tool results of a repository.
+
+        Args:
+            repository: Repository configuration
+
+        Returns:
+            Number of invalidated results
+        """
+        index_key = self._make_tool_result_index_key(repository)
+        tool_names = list(await self.cache.smembers(index_key))
+        if not tool_names:
+            return 0
+
+        invalidated = await self.cache.mdelete(
+            [self._make_tool_result_key(repository, name) for name in tool_names]
         )
-        return key.to_key()
+        await self.cache.srem(index_key, *tool_names)
+        return invalidated
 
     async def get_rule_file(
         self,
@@ -103,17 +251,75 @@ class CacheManager:
             File content or None if not cached
         """
         key = self._make_repository_key(repository, file_path)
-        content = await self.cache.get(key)
+        data = await self.cache.get(key)
 
-        if content:
+        if is_debug_enabled("cache.manager"):
             logger.debug(
-                "Cache hit for rule file", repository=repository.url, file=file_path
+                "Cache hit for rule file" if data else "Cache miss for rule file",
+                repository=repository.url,
+                file=file_path,
             )
-        else:
-            logger.debug(
-                "Cache miss for rule file", repository=repository.url, file=file_path
+
+        return data.decode("utf-8") if data is not None else None
+
+    async def get_or_fetch_rule_file(
+        self,
+        repository: GitLabRepository,
+        file_path: str,
+        fetch_function: Callable[[], Awaitable[str]],
+        ttl_seconds: int | None = None,
+    ) -> str:
+        """Get cached rule file content, fetching and caching it on a miss.
+
+        Concurrent misses for the same file share a single fetch.
+
+        Args:
+            repository: Repository configuration
+            file_path: File path within repository
+            fetch_function: Function to fetch the file content
+            ttl_seconds: TTL override (optional)
+
+        Returns:
+            File content
+        """
+        content = await self.get_rule_file(repository, file_path)
+        if content is not None:
+            return content
+
+        key = self._make_repository_key(repository, file_path)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_rule_file(
+                    repository, file_path, fetch_function, ttl_seconds
+                )
             )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
 
+        # Shield so a cancelled caller does not cancel the fetch for other waiters
+        return await asyncio.shield(task)
+
+    async def _fetch_rule_file(
+        self,
+        repository: GitLabRepository,
+        file_path: str,
+        fetch_function: Callable[[], Awaitable[str]],
+        ttl_seconds: int | None,
+    ) -> str:
+        """Fetch rule file content and cache it.
+
+        Args:
+            repository: Repository configuration
+            file_path: File path within repository
+            fetch_function: Function to fetch the file content
+            ttl_seconds: TTL override
+
+        Returns:
+            Fetched file content
+        """
+        content = await fetch_function()
+        await self.set_rule_file(repository, file_path, content, ttl_seconds)
         return content
 
     async def set_rule_file(
@@ -132,15 +338,20 @@ class CacheManager:
             ttl_seconds: TTL override (optional)
         """
         key = self._make_repository_key(repository, file_path)
-        await self.cache.set(key, content, ttl_seconds)
-
-        logger.debug(
-            "Cached rule file",
-            repository=repository.url,
-            file=file_path,
-            size=len(content),
+        data = content.encode("utf-8")
+        await self.cache.set(key, data, ttl_seconds)
+        await self.cache.sadd_entries(
+            self._make_index_key(repository), {key: file_path}
         )
 
+        if is_debug_enabled("cache.manager"):
+            logger.debug(
+                "Cached rule file",
+                repository=repository.url,
+                file=file_path,
+                size=len(data),
+            )
+
     async def cache_repository_rules(
         self,
         repository: GitLabRepository,
@@ -154,8 +365,20 @@ class CacheManager:
             rule_files: Dictionary mapping file paths to content
             ttl_seconds: TTL override (optional)
         """
-        for file_path, content in rule_files.items():
-            await self.set_rule_file(repository, file_path, content, ttl_seconds)
+        file_paths = list(rule_files)
+        index_key = self._make_index_key(repository)
+
+        # Write in batches so each backend call handles many entries at once
+        for i in range(0, len(file_paths), _KEY_BATCH_SIZE):
+            batch = file_paths[i : i + _KEY_BATCH_SIZE]
+            mapping: dict[CacheKey, bytes] = {}
+            members: dict[CacheKey, str] = {}
+            for path in batch:
+                key = self._make_repository_key(repository, path)
+                mapping[key] = rule_files[path].encode("utf-8")
+                members[key] = path
+            await self.cache.mset(mapping, ttl_seconds)
+            await self.cache.sadd_entries(index_key, members)
 
         logger.info(
             "Cached repository rules",
@@ -176,30 +399,63 @@ class CacheManager:
         Returns:
             Dictionary mapping file paths to content
         """
-        # Find all keys for this repository
-        pattern = f"{repository.url}:{repository.branch}:*"
-        rule_files = {}
+        # Look up the repository's files in its index and fetch them in batches
+        index_key = self._make_index_key(repository)
+        members = await self.cache.smembers(index_key)
+        if not members:
+            return {}
+
+        file_paths = sorted(members)
+        rule_files: dict[str, str] = {}
+        stale: list[str] = []
+
+        for i in range(0, len(file_paths), _KEY_BATCH_SIZE):
+            batch = file_paths[i : i + _KEY_BATCH_SIZE]
+            stale.extend(
+                await self._collect_rule_files(repository, batch, rule_files)
+            )
 
-        async for key in self.cache.keys(pattern):
-            try:
-                repo_key = RepositoryCacheKey.from_key(key)
-                content = await self.cache.get(key)
+        # Drop index members whose entries expired or were evicted
+        if stale:
+            await self.cache.srem(index_key, *stale)
 
-                if content:
-                    rule_files[repo_key.file_path] = content
+        if is_debug_enabled("cache.manager"):
+            logger.debug(
+                "Retrieved repository rules from cache",
+                repository=repository.url,
+                branch=repository.branch,
+                count=len(rule_files),
+            )
 
-            except Exception as e:
-                logger.warning("Failed to get cached rule file", key=key, error=str(e))
-                continue
+        return rule_files
 
-        logger.debug(
-            "Retrieved repository rules from cache",
-            repository=repository.url,
-            branch=repository.branch,
-            count=len(rule_files),
-        )
+    async def _collect_rule_files(
+        self,
+        repository: GitLabRepository,
+        file_paths: list[str],
+        rule_files: dict[str, str],
+    ) -> list[str]:
+        """Fetch a batch of rule files and add the cached contents.
 
-        return rule_files
+        Args:
+            repository: Repository configuration
+            file_paths: File paths within repository to fetch
+            rule_files: Dictionary to add file paths and content to
+
+        Returns:
+            File paths that are no longer cached
+        """
+        keys = [self._make_repository_key(repository, path) for path in file_paths]
+        values = await self.cache.mget(keys)
+        missing: list[str] = []
+
+        for file_path, data in zip(file_paths, values, strict=True):
+            if data is None:
+                missing.append(file_path)
+            elif data:
+                rule_files[file_path] = data.decode("utf-8")
+
+        return missing
 
     async def invalidate_repository(self, repository: GitLabRepository) -> int:
         """Invalidate all cached files for a repository.
@@ -210,12 +466,21 @@ class CacheManager:
         Returns:
             Number of invalidated entries
         """
-        pattern = f"{repository.url}:{repository.branch}:*"
+        index_key = self._make_index_key(repository)
+        file_paths = list(await self.cache.smembers(index_key))
         invalidated = 0
 
-        async for key in self.cache.keys(pattern):
-            if await self.cache.delete(key):
-                invalidated += 1
+        for i in range(0, len(file_paths), _KEY_BATCH_SIZE):
+            batch = file_paths[i : i + _KEY_BATCH_SIZE]
+            invalidated += await self.cache.mdelete(
+                [self._make_repository_key(repository, path) for path in batch]
+            )
+
+        if file_paths:
+            await self.cache.srem(index_key, *file_paths)
+
+        # Tool results embed file contents, so they go with the files
+        invalidated += await self._invalidate_tool_results(repository)
 
         logger.info(
             "Invalidated repository cache",
@@ -242,8 +507,10 @@ class CacheManager:
         """
         key = self._make_repository_key(repository, file_path)
         result = await self.cache.delete(key)
+        await self.cache.srem(self._make_index_key(repository), file_path)
+        await self._invalidate_tool_results(repository)
 
-        if result:
+        if result and is_debug_enabled("cache.manager"):
             logger.debug(
                 "Invalidated cached file", repository=repository.url, file=file_path
             )
@@ -253,15 +520,26 @@ class CacheManager:
     async def clear_all(self) -> None:
         """Clear all cached data."""
         await self.cache.clear()
+        self._stats_snapshot = None
         logger.info("Cleared all cached data")
 
     async def get_stats(self) -> CacheStats:
         """Get cache statistics.
 
+        Statistics are reused for up to a second, so bursts of callers
+        don't each walk the backend.
+
         Returns:
             Cache statistics
         """
-        return await self.cache.get_stats()
+        now = time.monotonic()
+        snapshot = self._stats_snapshot
+        if snapshot is not None and now - snapshot[0] < _STATS_MAX_AGE_SECONDS:
+            return snapshot[1]
+
+        stats = await self.cache.get_stats()
+        self._stats_snapshot = (now, stats)
+        return stats
 
     async def get_repository_stats(
         self, repository: GitLabRepository
@@ -274,11 +552,8 @@ class CacheManager:
         Returns:
             Repository-specific statistics
         """
-        pattern = f"{repository.url}:{repository.branch}:*"
-        file_count = 0
-
-        async for _ in self.cache.keys(pattern):
-            file_count += 1
+        # Index members leave with their entries, so the index size is live
+        file_count = await self.cache.scard(self._make_index_key(repository))
 
         return {
             "cached_files": file_count,
@@ -300,43 +575,54 @@ class CacheManager:
         self,
         repositories: list[GitLabRepository],
         fetch_function: Callable[[GitLabRepository], Awaitable[dict[str, str]]],
+        concurrency: int = 8,
     ) -> None:
         """Warm cache with rule files from repositories.
 
         Args:
             repositories: List of repositories to warm
             fetch_function: Function to fetch rule files
+            concurrency: Maximum number of repositories warmed at once
         """
+        # Warm each (url, branch) once even if it is listed repeatedly
+        repositories = list(dict.fromkeys(repositories))
         logger.info("Starting cache warm-up", repositories=len(repositories))
 
-        for repository in repositories:
-            try:
-                # Check if we already have cached data
-                cached_rules = await self.get_repository_rules(repository)
-                if cached_rules:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm_repository(repository: GitLabRepository) -> None:
+            async with semaphore:
+                try:
+                    # Check if we already have cached data
+                    cached_rules = await self.get_repository_rules(repository)
+                    if cached_rules:
+                        logger.debug(
+                            "Repository already cached, skipping warm-up",
+                            repository=repository.url,
+                        )
+                        return
+
+                    # Fetch fresh data
+                    rule_files = await fetch_function(repository)
+                    await self.cache_repository_rules(repository, rule_files)
+
                     logger.debug(
-                        "Repository already cached, skipping warm-up",
+                        "Warmed cache for repository",
                         repository=repository.url,
+                        count=len(rule_files),
                     )
-                    continue
-
-                # Fetch fresh data
-                rule_files = await fetch_function(repository)
-                await self.cache_repository_rules(repository, rule_files)
 
-                logger.debug(
-                    "Warmed cache for repository",
-                    repository=repository.url,
-                    count=len(rule_files),
-                )
+                except Exception as e:
+                    logger.error(
+                        "Failed to warm cache for repository",
+                        repository=repository.url,
+                        error=str(e),
+                    )
 
-            except Exception as e:
-                logger.error(
-                    "Failed to warm cache for repository",
-                    repository=repository.url,
-                    error=str(e),
-                )
-                continue
+        await asyncio.gather(
+            *(warm_repository(repository) for repository in repositories),
+            return_exceptions=True,
+        )
 
         logger.info("Cache warm-up completed")
 
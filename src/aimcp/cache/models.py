@@ -1,6 +1,7 @@
 """Cache-related data models."""
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -9,6 +10,9 @@ from pydantic import BaseModel, Field
 # Type alias for cache keys
 CacheKey = str
 
+# Byte count to megabytes factor
+_MB_PER_BYTE = 1.0 / (1024 * 1024)
+
 
 @dataclass
 class CacheEntry:
@@ -20,15 +24,26 @@ class CacheEntry:
     access_count: int = 0
     last_accessed: datetime | None = None
     size_bytes: int | None = None
+    _expires_monotonic: float | None = field(init=False, repr=False, compare=False)
+    _accessed_monotonic: float | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Convert the expiry time to the monotonic clock once."""
+        if self.ttl_seconds is None:
+            self._expires_monotonic = None
+            return
+
+        # Entries loaded from disk were created earlier; account for their age
+        age = (datetime.now() - self.created_at).total_seconds()
+        self._expires_monotonic = time.monotonic() - age + self.ttl_seconds
 
     @property
     def is_expired(self) -> bool:
         """Check if entry is expired."""
-        if self.ttl_seconds is None:
-            return False
-
-        expiry_time = self.created_at + timedelta(seconds=self.ttl_seconds)
-        return datetime.now() > expiry_time
+        expires = self._expires_monotonic
+        return expires is not None and time.monotonic() > expires
 
     @property
     def expires_at(self) -> datetime | None:
@@ -37,10 +52,19 @@ class CacheEntry:
             return None
         return self.created_at + timedelta(seconds=self.ttl_seconds)
 
+    @property
+    def last_access_time(self) -> datetime | None:
+        """Get wall-clock time of the last access, if any."""
+        if self._accessed_monotonic is None:
+            return self.last_accessed
+
+        elapsed = time.monotonic() - self._accessed_monotonic
+        return datetime.now() - timedelta(seconds=elapsed)
+
     def access(self) -> None:
         """Mark entry as accessed."""
         self.access_count += 1
-        self.last_accessed = datetime.now()
+        self._accessed_monotonic = time.monotonic()
 
 
 class CacheStats(BaseModel):
@@ -54,6 +78,20 @@ class CacheStats(BaseModel):
     oldest_entry: datetime | None = Field(default=None)
     newest_entry: datetime | None = Field(default=None)
 
+    @property
+    def memory_usage_mb(self) -> float | None:
+        """Memory usage in megabytes."""
+        if self.memory_usage_bytes is None:
+            return None
+        return self.memory_usage_bytes * _MB_PER_BYTE
+
+    @property
+    def storage_usage_mb(self) -> float | None:
+        """Storage usage in megabytes."""
+        if self.storage_usage_bytes is None:
+            return None
+        return self.storage_usage_bytes * _MB_PER_BYTE
+
     @property
     def hit_rate(self) -> float:
         """Calculate hit rate."""
@@ -68,31 +106,6 @@ class CacheStats(BaseModel):
         return 1.0 - self.hit_rate
 
 
-class RepositoryCacheKey(BaseModel):
-    """Repository-specific cache key."""
-
-    repository_url: str = Field(description="Repository URL")
-    branch: str = Field(description="Branch name")
-    file_path: str = Field(description="File path within repository")
-
-    def to_key(self) -> CacheKey:
-        """Convert to string cache key."""
-        return f"{self.repository_url}:{self.branch}:{self.file_path}"
-
-    @classmethod
-    def from_key(cls, key: CacheKey) -> "RepositoryCacheKey":
-        """Parse cache key back to components."""
-        parts = key.split(":", 2)
-        if len(parts) != 3:
-            raise ValueError(f"Invalid cache key format: {key}")
-
-        return cls(
-            repository_url=parts[0],
-            branch=parts[1],
-            file_path=parts[2],
-        )
-
-
 class CacheConfiguration(BaseModel):
     """Runtime cache configuration."""
 
@@ -1,5 +1,6 @@
 """Cache protocol definition."""
 
+import builtins
 from collections.abc import AsyncIterator
 from typing import Any, Protocol
 
@@ -46,6 +47,106 @@ class CacheProtocol(Protocol):
         """
         ...
 
+    async def mget(self, keys: list[CacheKey]) -> list[Any | None]:
+        """Get multiple values from cache in one operation.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values (None for missing/expired keys) in key order
+        """
+        ...
+
+    async def mset(
+        self,
+        mapping: dict[CacheKey, Any],
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """Set multiple values in cache in one operation.
+
+        Args:
+            mapping: Cache keys mapped to values
+            ttl_seconds: Optional TTL override applied to every value
+        """
+        ...
+
+    async def mdelete(self, keys: list[CacheKey]) -> int:
+        """Delete multiple values from cache in one operation.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        ...
+
+    async def sadd(self, key: CacheKey, *members: str) -> int:
+        """Add members to the set stored at key.
+
+        Sets live alongside regular entries and never expire on their own.
+
+        Args:
+            key: Set key
+            members: Members to add
+
+        Returns:
+            Number of members that were not already in the set
+        """
+        ...
+
+    async def sadd_entries(self, key: CacheKey, entries: dict[CacheKey, str]) -> int:
+        """Add members to the set stored at key, each tied to the entry it indexes.
+
+        A member is removed from the set when its entry is deleted, expires or
+        is evicted. Entries that are not cached are skipped.
+
+        Args:
+            key: Set key
+            entries: Mapping of indexed entry keys to their members
+
+        Returns:
+            Number of members that were not already in the set
+        """
+        ...
+
+    async def srem(self, key: CacheKey, *members: str) -> int:
+        """Remove members from the set stored at key.
+
+        The set is dropped once its last member is removed.
+
+        Args:
+            key: Set key
+            members: Members to remove
+
+        Returns:
+            Number of members that were removed
+        """
+        ...
+
+    async def smembers(self, key: CacheKey) -> builtins.set[str]:
+        """Get all members of the set stored at key.
+
+        Args:
+            key: Set key
+
+        Returns:
+            Set members (empty if the set does not exist)
+        """
+        ...
+
+    async def scard(self, key: CacheKey) -> int:
+        """Get number of members in the set stored at key.
+
+        Args:
+            key: Set key
+
+        Returns:
+            Number of set members (0 if the set does not exist)
+        """
+        ...
+
     async def exists(self, key: CacheKey) -> bool:
         """Check if key exists in cache.
 
@@ -1,22 +1,51 @@
 """Cache storage implementations."""
 
 import asyncio
+import base64
+import builtins
 import fnmatch
+import functools
+import hashlib
 import json
+import re
 import sys
 import tempfile
 from collections import OrderedDict
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from ..utils.logging import get_logger
+from ..utils.logging import get_logger, is_debug_enabled
 from .models import CacheEntry, CacheKey, CacheStats
 
 logger = get_logger("cache")
 
 
+@functools.lru_cache(maxsize=128)
+def _key_matcher(pattern: str | None) -> Callable[[CacheKey], bool]:
+    """Build a predicate matching cache keys against a glob pattern.
+
+    Patterns of the form ``prefix*`` are matched with a plain prefix check;
+    others are compiled to a regex. Predicates are memoized per pattern.
+
+    Args:
+        pattern: Optional glob pattern
+
+    Returns:
+        Predicate returning True for matching keys
+    """
+    if pattern is None:
+        return lambda key: True
+
+    head = pattern[:-1]
+    if pattern.endswith("*") and not any(c in head for c in "*?["):
+        return lambda key: key.startswith(head)
+
+    regex = re.compile(fnmatch.translate(pattern))
+    return lambda key: regex.match(key) is not None
+
+
 class MemoryCache:
     """In-memory cache with LRU eviction."""
 
@@ -30,6 +59,10 @@ class MemoryCache:
         self.max_size = max_size
         self.default_ttl_seconds = default_ttl_seconds
         self._cache: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        # Set members map to the entry they index, if any; links point back
+        # from an entry to its member so removing one drops the other
+        self._sets: dict[CacheKey, dict[str, CacheKey | None]] = {}
+        self._links: dict[CacheKey, tuple[CacheKey, str]] = {}
         self._lock = asyncio.Lock()
         self._stats = CacheStats(item_count=0)
 
@@ -44,8 +77,7 @@ class MemoryCache:
 
             # Check expiration
             if entry.is_expired:
-                del self._cache[key]
-                self._stats.item_count -= 1
+                self._remove(key)
                 self._stats.miss_count += 1
                 return None
 
@@ -64,45 +96,163 @@ class MemoryCache:
     ) -> None:
         """Set value in cache."""
         async with self._lock:
-            ttl = ttl_seconds or self.default_ttl_seconds
+            self._insert(
+                key, value, ttl_seconds or self.default_ttl_seconds, datetime.now()
+            )
+            self._evict_if_needed()
 
-            # Calculate size estimate
-            size_bytes = self._estimate_size(value)
+    async def mset(
+        self,
+        mapping: dict[CacheKey, Any],
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """Set multiple values in cache."""
+        ttl = ttl_seconds or self.default_ttl_seconds
+        # The batch is written at one instant; read the clock once for it
+        now = datetime.now()
+        async with self._lock:
+            for key, value in mapping.items():
+                self._insert(key, value, ttl, now)
+            self._evict_if_needed()
 
-            entry = CacheEntry(
-                value=value,
-                created_at=datetime.now(),
-                ttl_seconds=ttl,
-                size_bytes=size_bytes,
-            )
+    def _insert(
+        self, key: CacheKey, value: Any, ttl: int, created_at: datetime
+    ) -> None:
+        """Insert entry as most recently used; caller must hold the lock."""
+        entry = CacheEntry(
+            value=value,
+            created_at=created_at,
+            ttl_seconds=ttl,
+            size_bytes=self._estimate_size(value),
+        )
 
-            # Remove if already exists
-            if key in self._cache:
-                del self._cache[key]
-                self._stats.item_count -= 1
+        # Remove if already exists
+        if key in self._cache:
+            del self._cache[key]
+            self._stats.item_count -= 1
 
-            # Add new entry
-            self._cache[key] = entry
-            self._cache.move_to_end(key)
-            self._stats.item_count += 1
+        # Add new entry
+        self._cache[key] = entry
+        self._stats.item_count += 1
 
-            # Evict if over size limit
-            while len(self._cache) > self.max_size:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._stats.item_count -= 1
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used entries; caller must hold the lock."""
+        debug = is_debug_enabled("cache")
+        while len(self._cache) > self.max_size:
+            oldest_key = next(iter(self._cache))
+            self._remove(oldest_key)
 
+            if debug:
                 logger.debug("Evicted cache entry", key=oldest_key)
 
+    def _remove(self, key: CacheKey) -> None:
+        """Remove entry and the set member indexing it; caller must hold the lock."""
+        del self._cache[key]
+        self._stats.item_count -= 1
+
+        link = self._links.pop(key, None)
+        if link is None:
+            return
+        set_key, member = link
+        members = self._sets.get(set_key)
+        if members is not None and members.get(member) == key:
+            del members[member]
+            if not members:
+                del self._sets[set_key]
+
     async def delete(self, key: CacheKey) -> bool:
         """Delete value from cache."""
         async with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                self._stats.item_count -= 1
+                self._remove(key)
                 return True
             return False
 
+    async def mget(self, keys: list[CacheKey]) -> list[Any | None]:
+        """Get multiple values from cache."""
+        values: list[Any | None] = []
+        async with self._lock:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    self._stats.miss_count += 1
+                    values.append(None)
+                    continue
+
+                if entry.is_expired:
+                    self._remove(key)
+                    self._stats.miss_count += 1
+                    values.append(None)
+                    continue
+
+                self._cache.move_to_end(key)
+                entry.access()
+                self._stats.hit_count += 1
+                values.append(entry.value)
+
+        return values
+
+    async def mdelete(self, keys: list[CacheKey]) -> int:
+        """Delete multiple values from cache."""
+        deleted = 0
+        async with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._remove(key)
+                    deleted += 1
+        return deleted
+
+    async def sadd(self, key: CacheKey, *members: str) -> int:
+        """Add members to a set."""
+        async with self._lock:
+            current = self._sets.setdefault(key, {})
+            before = len(current)
+            for member in members:
+                current.setdefault(member, None)
+            return len(current) - before
+
+    async def sadd_entries(self, key: CacheKey, entries: dict[CacheKey, str]) -> int:
+        """Add members to a set, each tied to the entry it indexes."""
+        async with self._lock:
+            current = self._sets.setdefault(key, {})
+            before = len(current)
+            for entry_key, member in entries.items():
+                if entry_key not in self._cache:
+                    continue  # Already evicted; nothing to index
+                current[member] = entry_key
+                self._links[entry_key] = (key, member)
+            if not current:
+                del self._sets[key]
+            return len(current) - before
+
+    async def srem(self, key: CacheKey, *members: str) -> int:
+        """Remove members from a set."""
+        async with self._lock:
+            current = self._sets.get(key)
+            if current is None:
+                return 0
+
+            removed = 0
+            for member in members:
+                if member not in current:
+                    continue
+                entry = current.pop(member)
+                if entry is not None and self._links.get(entry) == (key, member):
+                    del self._links[entry]
+                removed += 1
+            if not current:
+                del self._sets[key]
+            return removed
+
+    async def smembers(self, key: CacheKey) -> builtins.set[str]:
+        """Get members of a set."""
+        async with self._lock:
+            return set(self._sets.get(key, ()))
+
+    async def scard(self, key: CacheKey) -> int:
+        """Get number of members in a set."""
+        return len(self._sets.get(key, ()))
+
     async def exists(self, key: CacheKey) -> bool:
         """Check if key exists."""
         async with self._lock:
@@ -111,8 +261,7 @@ class MemoryCache:
 
             entry = self._cache[key]
             if entry.is_expired:
-                del self._cache[key]
-                self._stats.item_count -= 1
+                self._remove(key)
                 return False
 
             return True
@@ -121,19 +270,25 @@ class MemoryCache:
         """Clear all entries."""
         async with self._lock:
             self._cache.clear()
+            self._sets.clear()
+            self._links.clear()
             self._stats.item_count = 0
             logger.info("Cleared memory cache")
 
     async def keys(self, pattern: str | None = None) -> AsyncIterator[CacheKey]:
         """Get cache keys."""
+        matches = _key_matcher(pattern)
+
+        # Snapshot valid matching keys under a single lock acquisition
         async with self._lock:
-            keys_list = list(self._cache.keys())
+            keys_list = [
+                key
+                for key, entry in self._cache.items()
+                if matches(key) and not entry.is_expired
+            ]
 
         for key in keys_list:
-            # Check if still valid
-            if await self.exists(key):
-                if pattern is None or fnmatch.fnmatch(key, pattern):
-                    yield key
+            yield key
 
     async def size(self) -> int:
         """Get cache size."""
@@ -167,8 +322,7 @@ class MemoryCache:
             ]
 
             for key in expired_keys:
-                del self._cache[key]
-                self._stats.item_count -= 1
+                self._remove(key)
 
             if expired_keys:
                 logger.info("Cleaned up expired entries", count=len(expired_keys))
@@ -184,6 +338,8 @@ class MemoryCache:
         try:
             if isinstance(value, str):
                 return len(value.encode("utf-8"))
+            elif isinstance(value, bytes):
+                return len(value)
             elif isinstance(value, int | float):
                 return sys.getsizeof(value)
             elif isinstance(value, list | tuple | dict):
@@ -223,6 +379,14 @@ class FileCache:
         self.index_path = self.storage_path / "index.json"
         self._load_index()
 
+        # Sets are kept in a subdirectory so they never count as entries
+        self.sets_path = self.storage_path / "sets"
+        self.sets_path.mkdir(exist_ok=True)
+
+        # Entry file -> (set key, member) for set members tied to an entry
+        self._links: dict[Path, tuple[CacheKey, str]] = {}
+        self._load_links()
+
     def _load_index(self) -> None:
         """Load cache index from disk."""
         if self.index_path.exists():
@@ -256,8 +420,8 @@ class FileCache:
 
     def _get_file_path(self, key: CacheKey) -> Path:
         """Get file path for cache key."""
-        # Use hash to avoid filesystem issues with special characters
-        key_hash = str(hash(key))
+        # Use a stable digest to avoid filesystem issues with special characters
+        key_hash = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
         return self.storage_path / f"{key_hash}.json"
 
     async def get(self, key: CacheKey) -> Any | None:
@@ -273,8 +437,12 @@ class FileCache:
                 data = json.load(f)
 
             # Parse entry
+            value = data["value"]
+            if data.get("encoding") == "base64":
+                value = base64.b64decode(value)
+
             entry = CacheEntry(
-                value=data["value"],
+                value=value,
                 created_at=datetime.fromisoformat(data["created_at"]),
                 ttl_seconds=data.get("ttl_seconds"),
                 access_count=data.get("access_count", 0),
@@ -287,6 +455,7 @@ class FileCache:
             # Check expiration
             if entry.is_expired:
                 file_path.unlink(missing_ok=True)
+                self._prune_index([file_path])
                 self._stats.miss_count += 1
                 return None
 
@@ -318,9 +487,7 @@ class FileCache:
                 value=value,
                 created_at=datetime.now(),
                 ttl_seconds=ttl,
-                size_bytes=len(str(value).encode("utf-8"))
-                if isinstance(value, str)
-                else None,
+                size_bytes=self._value_size(value),
             )
 
             await self._save_entry(key, entry)
@@ -334,19 +501,61 @@ class FileCache:
 
             self._save_index()
 
+    async def mset(
+        self,
+        mapping: dict[CacheKey, Any],
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """Set multiple values in cache."""
+        ttl = ttl_seconds or self.default_ttl_seconds
+        # The batch is written at one instant; read the clock once for it
+        now = datetime.now()
+        async with self._lock:
+            for key, value in mapping.items():
+                is_new = not self._get_file_path(key).exists()
+                entry = CacheEntry(
+                    value=value,
+                    created_at=now,
+                    ttl_seconds=ttl,
+                    size_bytes=self._value_size(value),
+                )
+                await self._save_entry(key, entry)
+                if is_new:
+                    self._stats.item_count += 1
+
+            # Evict and persist stats once for the whole batch
+            await self._evict_if_needed()
+            self._save_index()
+
+    @staticmethod
+    def _value_size(value: Any) -> int | None:
+        """Get encoded size of text and binary values."""
+        if isinstance(value, bytes):
+            return len(value)
+        if isinstance(value, str):
+            return len(value.encode("utf-8"))
+        return None
+
     async def _save_entry(self, key: CacheKey, entry: CacheEntry) -> None:
         """Save entry to file."""
         file_path = self._get_file_path(key)
 
+        # JSON has no binary type, so bytes values are stored base64-encoded
+        value = entry.value
+        encoding = None
+        if isinstance(value, bytes):
+            value = base64.b64encode(value).decode("ascii")
+            encoding = "base64"
+
+        last_accessed = entry.last_access_time
         data = {
             "key": key,
-            "value": entry.value,
+            "value": value,
+            "encoding": encoding,
             "created_at": entry.created_at.isoformat(),
             "ttl_seconds": entry.ttl_seconds,
             "access_count": entry.access_count,
-            "last_accessed": entry.last_accessed.isoformat()
-            if entry.last_accessed
-            else None,
+            "last_accessed": last_accessed.isoformat() if last_accessed else None,
             "size_bytes": entry.size_bytes,
         }
 
@@ -379,6 +588,7 @@ class FileCache:
         for file_path in cache_files[:to_remove]:
             file_path.unlink(missing_ok=True)
             self._stats.item_count -= 1
+        self._prune_index(cache_files[:to_remove])
 
         logger.debug("Evicted cache files", count=to_remove)
 
@@ -387,11 +597,172 @@ class FileCache:
         file_path = self._get_file_path(key)
         if file_path.exists():
             file_path.unlink()
+            self._prune_index([file_path])
             self._stats.item_count -= 1
             self._save_index()
             return True
         return False
 
+    async def mget(self, keys: list[CacheKey]) -> list[Any | None]:
+        """Get multiple values from cache."""
+        return [await self.get(key) for key in keys]
+
+    async def mdelete(self, keys: list[CacheKey]) -> int:
+        """Delete multiple values from cache."""
+        file_paths = [self._get_file_path(key) for key in keys]
+
+        # Unlink in a worker thread so large batches do not block the event loop
+        deleted = await asyncio.to_thread(self._unlink_files, file_paths)
+        self._prune_index(file_paths)
+
+        if deleted:
+            self._stats.item_count -= deleted
+            self._save_index()
+        return deleted
+
+    @staticmethod
+    def _unlink_files(file_paths: list[Path]) -> int:
+        """Unlink cache files, skipping ones that are already gone."""
+        deleted = 0
+        for file_path in file_paths:
+            try:
+                file_path.unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+        return deleted
+
+    def _get_set_path(self, key: CacheKey) -> Path:
+        """Get file path for set key."""
+        key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.sets_path / f"{key_hash}.json"
+
+    def _read_set(self, key: CacheKey) -> dict[str, CacheKey | None]:
+        """Read set members, with the entry each one indexes, from disk."""
+        set_path = self._get_set_path(key)
+        if not set_path.exists():
+            return {}
+
+        try:
+            with set_path.open("r") as f:
+                members = json.load(f).get("members", {})
+        except Exception as e:
+            logger.warning("Failed to read cache set", key=key, error=str(e))
+            return {}
+
+        # Sets written before members were tied to entries are plain lists
+        return dict.fromkeys(members) if isinstance(members, list) else members
+
+    def _write_set(self, key: CacheKey, members: dict[str, CacheKey | None]) -> None:
+        """Write set members to disk, removing the file when empty."""
+        set_path = self._get_set_path(key)
+        if not members:
+            set_path.unlink(missing_ok=True)
+            return
+
+        # Atomic write
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            dir=self.sets_path,
+            delete=False,
+            suffix=".tmp",
+        ) as f:
+            json.dump({"key": key, "members": members}, f, sort_keys=True)
+            temp_path = Path(f.name)
+
+        temp_path.replace(set_path)
+
+    def _load_links(self) -> None:
+        """Rebuild links from entry files to set members from the set files."""
+        for set_path in self.sets_path.glob("*.json"):
+            try:
+                with set_path.open("r") as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.warning("Failed to read cache set", file=set_path, error=str(e))
+                continue
+
+            members = data.get("members")
+            if not isinstance(members, dict):
+                continue
+            for member, entry_key in members.items():
+                if entry_key is not None:
+                    self._links[self._get_file_path(entry_key)] = (data["key"], member)
+
+    def _prune_index(self, file_paths: list[Path]) -> None:
+        """Remove the set members tied to removed entry files."""
+        removed: dict[CacheKey, list[tuple[Path, str]]] = {}
+        for file_path in file_paths:
+            link = self._links.pop(file_path, None)
+            if link is not None:
+                removed.setdefault(link[0], []).append((file_path, link[1]))
+
+        # Each affected set is read and written once
+        for set_key, links in removed.items():
+            members = self._read_set(set_key)
+            before = len(members)
+            for file_path, member in links:
+                entry = members.get(member)
+                if entry is not None and self._get_file_path(entry) == file_path:
+                    del members[member]
+            if len(members) != before:
+                self._write_set(set_key, members)
+
+    async def sadd(self, key: CacheKey, *members: str) -> int:
+        """Add members to a set."""
+        async with self._lock:
+            current = self._read_set(key)
+            before = len(current)
+            for member in members:
+                current.setdefault(member, None)
+            added = len(current) - before
+            if added:
+                self._write_set(key, current)
+            return added
+
+    async def sadd_entries(self, key: CacheKey, entries: dict[CacheKey, str]) -> int:
+        """Add members to a set, each tied to the entry it indexes."""
+        async with self._lock:
+            current = self._read_set(key)
+            before = len(current)
+            linked = False
+            for entry_key, member in entries.items():
+                file_path = self._get_file_path(entry_key)
+                if not file_path.exists():
+                    continue  # Already evicted; nothing to index
+                current[member] = entry_key
+                self._links[file_path] = (key, member)
+                linked = True
+            if linked:
+                self._write_set(key, current)
+            return len(current) - before
+
+    async def srem(self, key: CacheKey, *members: str) -> int:
+        """Remove members from a set."""
+        async with self._lock:
+            current = self._read_set(key)
+            removed = 0
+            for member in members:
+                if member not in current:
+                    continue
+                entry_key = current.pop(member)
+                if entry_key is not None:
+                    file_path = self._get_file_path(entry_key)
+                    if self._links.get(file_path) == (key, member):
+                        del self._links[file_path]
+                removed += 1
+            if removed:
+                self._write_set(key, current)
+            return removed
+
+    async def smembers(self, key: CacheKey) -> builtins.set[str]:
+        """Get members of a set."""
+        return set(self._read_set(key))
+
+    async def scard(self, key: CacheKey) -> int:
+        """Get number of members in a set."""
+        return len(self._read_set(key))
+
     async def exists(self, key: CacheKey) -> bool:
         """Check if key exists."""
         file_path = self._get_file_path(key)
@@ -409,6 +780,10 @@ class FileCache:
                 if file_path != self.index_path:
                     file_path.unlink(missing_ok=True)
 
+            for set_path in self.sets_path.glob("*.json"):
+                set_path.unlink(missing_ok=True)
+            self._links.clear()
+
             self._stats.item_count = 0
             self._save_index()
 
@@ -416,6 +791,8 @@ class FileCache:
 
     async def keys(self, pattern: str | None = None) -> AsyncIterator[CacheKey]:
         """Get cache keys."""
+        matches = _key_matcher(pattern)
+
         for file_path in self.storage_path.glob("*.json"):
             if file_path == self.index_path:
                 continue
@@ -425,9 +802,9 @@ class FileCache:
                     data = json.load(f)
                     key = data.get("key")
 
-                    if key and await self.exists(key):
-                        if pattern is None or fnmatch.fnmatch(key, pattern):
-                            yield key
+                    # Match first; exists() reads and rewrites the entry file
+                    if key and matches(key) and await self.exists(key):
+                        yield key
 
             except Exception as e:
                 logger.warning(
@@ -444,34 +821,35 @@ class FileCache:
 
     async def get_stats(self) -> CacheStats:
         """Get cache statistics."""
-        # Calculate storage usage
-        storage_usage = sum(
-            f.stat().st_size
-            for f in self.storage_path.glob("*.json")
-            if f != self.index_path
-        )
-
-        # Get file timestamps
+        # One directory scan and one stat per file for all figures
+        storage_usage = 0
         timestamps = []
         for file_path in self.storage_path.glob("*.json"):
             if file_path == self.index_path:
                 continue
-            timestamps.append(datetime.fromtimestamp(file_path.stat().st_mtime))
-
-        current_stats = await self.size()
+            try:
+                file_stat = file_path.stat()
+            except FileNotFoundError:
+                continue  # Removed since the scan
+            storage_usage += file_stat.st_size
+            timestamps.append(file_stat.st_mtime)
 
         return CacheStats(
-            item_count=current_stats,
+            item_count=len(timestamps),
             hit_count=self._stats.hit_count,
             miss_count=self._stats.miss_count,
             storage_usage_bytes=storage_usage,
-            oldest_entry=min(timestamps) if timestamps else None,
-            newest_entry=max(timestamps) if timestamps else None,
+            oldest_entry=(
+                datetime.fromtimestamp(min(timestamps)) if timestamps else None
+            ),
+            newest_entry=(
+                datetime.fromtimestamp(max(timestamps)) if timestamps else None
+            ),
         )
 
     async def cleanup_expired(self) -> int:
         """Clean up expired entries."""
-        expired_count = 0
+        expired: list[Path] = []
 
         for file_path in self.storage_path.glob("*.json"):
             if file_path == self.index_path:
@@ -489,7 +867,7 @@ class FileCache:
 
                 if entry.is_expired:
                     file_path.unlink()
-                    expired_count += 1
+                    expired.append(file_path)
                     self._stats.item_count -= 1
 
             except Exception as e:
@@ -500,11 +878,12 @@ class FileCache:
                 )
                 continue
 
-        if expired_count > 0:
+        if expired:
+            self._prune_index(expired)
             self._save_index()
-            logger.info("Cleaned up expired cache files", count=expired_count)
+            logger.info("Cleaned up expired cache files", count=len(expired))
 
-        return expired_count
+        return len(expired)
 
     async def close(self) -> None:
         """Close cache."""
@@ -0,0 +1 @@
+"""CLI command implementations."""
@@ -0,0 +1,43 @@
+"""Implementation of the ``cache-clear`` command."""
+
+from pathlib import Path
+
+import typer
+from pydantic import ValidationError
+
+from ..cache.factory import create_cache_manager
+from ..config.models import AIMCPConfig
+from .common import load_config, run_async
+
+
+async def _clear_cache(config_obj: AIMCPConfig) -> None:
+    """Clear all cached data.
+
+    Args:
+        config_obj: Application configuration
+    """
+    cache_manager = create_cache_manager(config_obj.cache)
+    async with cache_manager:
+        await cache_manager.clear_all()
+        typer.echo("✓ Cache cleared successfully")
+
+
+def run(config: Path) -> None:
+    """Clear the cache.
+
+    Args:
+        config: Path to configuration file
+    """
+    try:
+        config_obj = load_config(config)
+
+        typer.echo("Clearing cache...")
+
+        run_async(_clear_cache(config_obj))
+
+    except ValidationError as e:
+        typer.echo(f"Configuration error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error clearing cache: {e}", err=True)
+        raise typer.Exit(1)
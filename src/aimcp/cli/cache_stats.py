@@ -0,0 +1,67 @@
+"""Implementation of the ``cache-stats`` command."""
+
+from pathlib import Path
+
+import typer
+from pydantic import ValidationError
+
+from ..cache.factory import create_cache_manager
+from ..config.models import AIMCPConfig
+from .common import load_config, run_async
+
+
+async def _show_stats(config_obj: AIMCPConfig) -> None:
+    """Print cache statistics.
+
+    Args:
+        config_obj: Application configuration
+    """
+    cache_manager = create_cache_manager(config_obj.cache)
+    async with cache_manager:
+        stats = await cache_manager.get_stats()
+
+        lookups = stats.hit_count + stats.miss_count
+        lines = [
+            f"Backend: {config_obj.cache.backend.value}",
+            f"Items: {stats.item_count}",
+            f"Hit rate: {stats.hit_rate:.2%} ({stats.hit_count}/{lookups})",
+        ]
+
+        if stats.memory_usage_bytes:
+            lines.append(f"Memory usage: {stats.memory_usage_mb:.2f} MB")
+
+        if stats.storage_usage_bytes:
+            lines.append(f"Storage usage: {stats.storage_usage_mb:.2f} MB")
+
+        if stats.oldest_entry:
+            lines.append(f"Oldest entry: {stats.oldest_entry}")
+        if stats.newest_entry:
+            lines.append(f"Newest entry: {stats.newest_entry}")
+
+        # Show configured repositories
+        lines.append(f"\nRepositories: {len(config_obj.gitlab.repositories)}")
+        for repo in config_obj.gitlab.repositories:
+            lines.append(f"  {repo.url}:{repo.branch}")
+
+        typer.echo("\n".join(lines))
+
+
+def run(config: Path) -> None:
+    """Show cache statistics.
+
+    Args:
+        config: Path to configuration file
+    """
+    try:
+        config_obj = load_config(config)
+
+        typer.echo("Cache statistics:")
+
+        run_async(_show_stats(config_obj))
+
+    except ValidationError as e:
+        typer.echo(f"Configuration error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error getting cache stats: {e}", err=True)
+        raise typer.Exit(1)
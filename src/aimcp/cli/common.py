@@ -0,0 +1,78 @@
+"""Shared helpers for CLI commands."""
+
+import asyncio
+import functools
+import os
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any
+
+from ..config.models import AIMCPConfig
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the event loop factory, preferring uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return None  # Fall back to the default asyncio event loop
+    return uvloop.new_event_loop
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a single event loop.
+
+    Args:
+        coro: Top-level coroutine of the command
+
+    Returns:
+        Coroutine result
+    """
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        return runner.run(coro)
+
+
+def load_config(
+    config_path: Path | None,
+    overrides: dict[str, Any] | None = None,
+    *,
+    allow_trusted: bool = True,
+) -> AIMCPConfig:
+    """Load configuration, reusing the parsed result while the file is unchanged.
+
+    When ``AIMCP_TRUST_CONFIG=1`` is set, the file is loaded without
+    re-validation (see ``AIMCPConfig.from_trusted_yaml_file``).
+
+    Args:
+        config_path: Optional path to configuration file
+        overrides: Optional settings to override
+        allow_trusted: Whether the trusted (unvalidated) load path may be used
+
+    Returns:
+        AIMCP configuration
+    """
+    if config_path is None:
+        return AIMCPConfig.create(None, overrides)
+
+    trusted = allow_trusted and os.environ.get("AIMCP_TRUST_CONFIG") == "1"
+    return _load_config_cached(
+        str(config_path.resolve()),
+        config_path.stat().st_mtime_ns,
+        tuple(sorted((overrides or {}).items())),
+        trusted,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    path_str: str,
+    mtime_ns: int,
+    overrides_key: tuple[tuple[str, Any], ...],
+    trusted: bool,
+) -> AIMCPConfig:
+    """Parse a configuration file, memoized on path and mtime."""
+    if trusted:
+        return AIMCPConfig.from_trusted_yaml_file(
+            Path(path_str), dict(overrides_key) or None
+        )
+    return AIMCPConfig.create(Path(path_str), dict(overrides_key) or None)
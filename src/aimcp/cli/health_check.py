@@ -0,0 +1,100 @@
+"""Implementation of the ``health-check`` command."""
+
+from pathlib import Path
+
+import typer
+from pydantic import ValidationError
+
+from ..cache.factory import create_cache_manager
+from ..config.models import AIMCPConfig
+from ..gitlab.client import GitLabClient
+from ..utils.health import CacheHealthChecker, GitLabHealthChecker, SystemHealthChecker
+from .common import load_config, run_async
+
+# Health status display lookups
+_STATUS_COLORS = {
+    "healthy": typer.colors.GREEN,
+    "degraded": typer.colors.YELLOW,
+    "unhealthy": typer.colors.RED,
+}
+_STATUS_SYMBOLS = {
+    "healthy": "✓",
+    "degraded": "⚠",
+    "unhealthy": "✗",
+}
+
+
+async def _check_health(config_obj: AIMCPConfig) -> None:
+    """Run system health checks and print the results.
+
+    Args:
+        config_obj: Application configuration
+    """
+    # Create components
+    cache_manager = create_cache_manager(config_obj.cache)
+
+    # Run health checks sharing one pooled GitLab session
+    async with GitLabClient(config_obj.gitlab) as gitlab_client, cache_manager:
+        gitlab_checker = GitLabHealthChecker(
+            gitlab_client, config_obj.gitlab.repositories
+        )
+        cache_checker = CacheHealthChecker(cache_manager)
+
+        system_checker = SystemHealthChecker([gitlab_checker, cache_checker])
+        system_health = await system_checker.check_all()
+
+        # Display results
+        style = typer.style
+        default_color = typer.colors.WHITE
+
+        color = _STATUS_COLORS.get(system_health.status, default_color)
+        lines = [
+            "\nSystem Health: "
+            + style(system_health.status.upper(), fg=color, bold=True),
+            f"Checked at: {system_health.checked_at.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+        ]
+
+        for check in system_health.checks:
+            status_symbol = _STATUS_SYMBOLS.get(check.status, "?")
+            check_color = _STATUS_COLORS.get(check.status, default_color)
+
+            lines.append(
+                f"\n{status_symbol} "
+                + style(f"{check.component.upper()}: {check.status}", fg=check_color)
+            )
+            lines.append(f"  Message: {check.message}")
+
+            if check.details:
+                lines.append("  Details:")
+                for key, value in check.details.items():
+                    lines.append(f"    {key}: {value}")
+
+        typer.echo("\n".join(lines))
+
+        # Set exit code based on overall health
+        if system_health.status == "unhealthy":
+            raise typer.Exit(2)  # Critical health issues
+        elif system_health.status == "degraded":
+            raise typer.Exit(1)  # Warning health issues
+        # Healthy = exit code 0
+
+
+def run(config: Path) -> None:
+    """Check system health status.
+
+    Args:
+        config: Path to configuration file
+    """
+    try:
+        config_obj = load_config(config)
+
+        typer.echo("Checking system health...")
+
+        run_async(_check_health(config_obj))
+
+    except ValidationError as e:
+        typer.echo(f"Configuration error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error checking health: {e}", err=True)
+        raise typer.Exit(1)
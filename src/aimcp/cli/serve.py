@@ -0,0 +1,108 @@
+"""Implementation of the ``serve`` command."""
+
+import asyncio
+import signal
+from pathlib import Path
+
+import typer
+from pydantic import ValidationError
+
+from ..config.models import AIMCPConfig
+from ..server.factory import create_mcp_server
+from ..utils.logging import setup_logging
+from .common import load_config, run_async
+
+
+async def _run_server(config_obj: AIMCPConfig) -> None:
+    """Create the MCP server and run it until shutdown.
+
+    Args:
+        config_obj: Application configuration
+    """
+    server = await create_mcp_server(config_obj)
+
+    try:
+        server_runner = await server.get_server_runner()
+        typer.echo("✓ AIMCP server started successfully")
+        typer.echo("Press Ctrl+C to stop the server")
+
+        # Wait on either the server finishing or a shutdown signal
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass  # Signal handlers are not supported on Windows
+
+        server_task = asyncio.create_task(server_runner())
+        stop_task = asyncio.create_task(stop_event.wait())
+        await asyncio.wait(
+            {server_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if stop_event.is_set():
+            typer.echo("\nShutting down server...")
+            server_task.cancel()
+        else:
+            stop_task.cancel()
+
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
+    except KeyboardInterrupt:
+        typer.echo("\nShutting down server...")
+    except Exception as e:
+        typer.echo(f"✗ Server failed to start: {e}", err=True)
+        raise typer.Exit(1) from e
+    finally:
+        await server.cleanup()
+
+
+def run(
+    config: Path | None,
+    host: str | None,
+    port: int | None,
+    transport: str | None,
+) -> None:
+    """Start the AIMCP MCP server.
+
+    Args:
+        config: Optional path to configuration file
+        host: Server host override
+        port: Server port override
+        transport: Transport type override
+    """
+    try:
+        # Build override settings
+        overrides: dict[str, str | int] = {}
+        if host:
+            overrides["host"] = host
+        if port:
+            overrides["port"] = port
+        if transport:
+            overrides["transport"] = transport
+
+        # Load configuration
+        config_obj = load_config(config, overrides)
+
+        # Setup logging
+        setup_logging(config_obj.logging)
+
+        # Start server
+        typer.echo(f"Starting AIMCP server: {config_obj.server.name}")
+        typer.echo(f"Transport: {config_obj.server.transport.value}")
+        if config_obj.server.transport.value != "stdio":
+            typer.echo(f"Address: {config_obj.server.host}:{config_obj.server.port}")
+        typer.echo(f"Monitoring {len(config_obj.gitlab.repositories)} repositories")
+        typer.echo(f"Cache backend: {config_obj.cache.backend.value}")
+
+        run_async(_run_server(config_obj))
+
+    except ValidationError as e:
+        typer.echo(f"Configuration error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error starting server: {e}", err=True)
+        raise typer.Exit(1)
@@ -0,0 +1,129 @@
+"""Implementation of the ``test-gitlab`` command."""
+
+import asyncio
+from pathlib import Path
+
+import typer
+from pydantic import ValidationError
+
+from ..config.models import AIMCPConfig, GitLabRepository
+from ..gitlab.client import GitLabClient, GitLabClientError
+from ..gitlab.models import GitLabProbeResult
+from .common import load_config, run_async
+
+
+def _format_probe(probe: GitLabProbeResult) -> list[str]:
+    """Format a batched repository probe result.
+
+    Args:
+        probe: Probe result from GitLabClient.batch_probe
+
+    Returns:
+        Output lines describing the probe result
+    """
+    if probe.error:
+        return [f"✗ {probe.repository} - Error: {probe.error}"]
+
+    lines = [f"✓ {probe.repository} - {probe.project_name}"]
+    if probe.tools_json_size is not None:
+        lines.append(f"  ✓ Found tools.json ({probe.tools_json_size} bytes)")
+    else:
+        lines.append("  ⚠ No tools.json found")
+    return lines
+
+
+async def _probe_repository(
+    client: GitLabClient,
+    repo: GitLabRepository,
+    semaphore: asyncio.Semaphore,
+) -> list[str]:
+    """Probe repository access and tools.json availability.
+
+    Args:
+        client: GitLab client shared across probes
+        repo: Repository configuration
+        semaphore: Semaphore bounding concurrent probes
+
+    Returns:
+        Output lines describing the probe result
+    """
+    lines: list[str] = []
+    async with semaphore:
+        try:
+            project = await client.get_project(repo.url)
+            lines.append(f"✓ {repo.url} - {project.name}")
+
+            # Test tools.json detection
+            has_tools = await client.check_tools_json_exists(repo)
+            if has_tools:
+                try:
+                    tools_content = await client.fetch_tools_json(repo)
+                    lines.append(f"  ✓ Found tools.json ({len(tools_content)} bytes)")
+                except Exception as e:
+                    lines.append(f"  ⚠ tools.json exists but failed to fetch: {e}")
+            else:
+                lines.append("  ⚠ No tools.json found")
+
+        except Exception as e:
+            lines.append(f"✗ {repo.url} - Error: {e}")
+
+    return lines
+
+
+async def _test_connection(config_obj: AIMCPConfig) -> None:
+    """Test GitLab connection and probe configured repositories.
+
+    Args:
+        config_obj: Application configuration
+    """
+    async with GitLabClient(config_obj.gitlab) as client:
+        # Test basic connection
+        result = await client.test_connection()
+        if result["status"] == "success":
+            typer.echo(f"✓ Connected as user: {result['user']}")
+            typer.echo(f"  GitLab version: {result['gitlab_version']}")
+        else:
+            typer.echo(f"✗ Connection failed: {result['error']}")
+            raise typer.Exit(1)
+
+        # Test repository access
+        echo = typer.echo
+        echo("\nTesting repository access:")
+        try:
+            probes = await client.batch_probe(config_obj.gitlab.repositories)
+        except GitLabClientError:
+            # GraphQL unavailable - fall back to per-repository REST calls,
+            # printing each result as soon as its probe finishes
+            semaphore = asyncio.Semaphore(config_obj.gitlab.concurrency)
+            tasks = [
+                asyncio.create_task(_probe_repository(client, repo, semaphore))
+                for repo in config_obj.gitlab.repositories
+            ]
+            for next_result in asyncio.as_completed(tasks):
+                echo("\n".join(await next_result))
+            return
+
+        for probe in probes:
+            echo("\n".join(_format_probe(probe)))
+
+
+def run(config: Path) -> None:
+    """Test GitLab connectivity and repository access.
+
+    Args:
+        config: Path to configuration file
+    """
+    try:
+        config_obj = load_config(config)
+
+        typer.echo("Testing GitLab connectivity...")
+        typer.echo(f"Instance: {config_obj.gitlab.instance_url}")
+
+        run_async(_test_connection(config_obj))
+
+    except ValidationError as e:
+        typer.echo(f"Configuration error: {e}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error testing GitLab: {e}", err=True)
+        raise typer.Exit(1)
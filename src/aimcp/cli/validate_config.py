@@ -0,0 +1,36 @@
+"""Implementation of the ``validate-config`` command."""
+
+from pathlib import Path
+
+import typer
+from pydantic import ValidationError
+
+from .common import load_config
+
+
+def run(config: Path) -> None:
+    """Validate configuration file.
+
+    Args:
+        config: Path to configuration file
+    """
+    try:
+        config_obj = load_config(config, allow_trusted=False)
+
+        typer.echo("✓ Configuration is valid")
+        server = config_obj.server
+        typer.echo(f"  Server: {server.host}:{server.port} ({server.transport})")
+        typer.echo(f"  GitLab: {config_obj.gitlab.instance_url}")
+        typer.echo(f"  Repositories: {len(config_obj.gitlab.repositories)}")
+        cache = config_obj.cache
+        typer.echo(f"  Cache: {cache.backend} (TTL: {cache.ttl_seconds}s)")
+
+    except ValidationError as e:
+        typer.echo("✗ Configuration validation failed:", err=True)
+        for error in e.errors():
+            location = " -> ".join(str(loc) for loc in error["loc"])
+            typer.echo(f"  {location}: {error['msg']}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"Error loading configuration: {e}", err=True)
+        raise typer.Exit(1)
@@ -1,13 +1,20 @@
 """Configuration models for AIMCP."""
 
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
 from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader  # type: ignore[assignment]
+
 
 class TransportType(StrEnum):
     """MCP server transport types."""
@@ -37,6 +44,8 @@ class CacheBackend(StrEnum):
 class ServerConfig(BaseModel):
     """Server configuration."""
 
+    model_config = {"frozen": True}
+
     host: str = Field(default="127.0.0.1")
     port: int = Field(default=8000)
     transport: TransportType = Field(default=TransportType.STDIO)
@@ -65,15 +74,29 @@ class GitLabRepository(BaseModel):
         """Clean up repository URL by removing leading and trailing slashes."""
         return v.strip("/")
 
+    @cached_property
+    def cache_key_prefix(self) -> str:
+        """Prefix shared by cache keys of this repository's files."""
+        return f"{self.url}:{self.branch}:"
+
+    @cached_property
+    def short_name(self) -> str:
+        """Last path segment of the repository URL (e.g. "project")."""
+        return self.url.rpartition("/")[2]
+
 
 class GitLabConfig(BaseModel):
     """GitLab API configuration."""
 
+    model_config = {"frozen": True}
+
     instance_url: HttpUrl
     token: str
     repositories: list[GitLabRepository]
     timeout: int = 30
     max_retries: int = 3
+    concurrency: int = 10
+    max_connections: int = 64
 
     @field_validator("token")
     @classmethod
@@ -83,6 +106,22 @@ class GitLabConfig(BaseModel):
             raise ValueError("GitLab token is required and cannot be empty")
         return v.strip()
 
+    @field_validator("concurrency")
+    @classmethod
+    def validate_concurrency(cls, v: int) -> int:
+        """Validate concurrent request limit is positive."""
+        if v < 1:
+            raise ValueError("GitLab concurrency must be at least 1")
+        return v
+
+    @field_validator("max_connections")
+    @classmethod
+    def validate_max_connections(cls, v: int) -> int:
+        """Validate connection pool size is positive."""
+        if v < 1:
+            raise ValueError("GitLab max_connections must be at least 1")
+        return v
+
     @field_validator("repositories")
     @classmethod
     def validate_repositories(cls, v: list[GitLabRepository]) -> list[GitLabRepository]:
@@ -95,10 +134,21 @@ class GitLabConfig(BaseModel):
 class CacheConfig(BaseModel):
     """Cache configuration."""
 
+    model_config = {"frozen": True}
+
     backend: CacheBackend = CacheBackend.MEMORY
     ttl_seconds: int = 3600
     max_size: int = 1000
     storage_path: Path | None = None
+    cleanup_interval_seconds: int = 300
+
+    @field_validator("cleanup_interval_seconds")
+    @classmethod
+    def validate_cleanup_interval(cls, v: int) -> int:
+        """Validate cleanup interval is positive."""
+        if v < 1:
+            raise ValueError("Cache cleanup interval must be at least 1 second")
+        return v
 
     @model_validator(mode="after")
     def validate_file_backend(self) -> "CacheConfig":
@@ -111,6 +161,8 @@ class CacheConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
+    model_config = {"frozen": True}
+
     level: LogLevel = LogLevel.INFO
     structured: bool = True
     format: str | None = None
@@ -119,10 +171,13 @@ class LoggingConfig(BaseModel):
 class ToolConfig(BaseModel):
     """Tool processing configuration."""
 
+    model_config = {"frozen": True}
+
     conflict_resolution_strategy: str = "prefix"
     max_file_size: int = 1024 * 1024
     encoding: str = "utf-8"
     max_auto_load_size: int = 10 * 1024  # 10KB default for auto-loading resources
+    max_auto_load_text_size: int = 50_000  # Auto-load limit for text MIME types
 
     @field_validator("conflict_resolution_strategy")
     @classmethod
@@ -134,6 +189,46 @@ class ToolConfig(BaseModel):
         return v
 
 
+# CLI override keys that belong to the server section
+_SERVER_OVERRIDE_KEYS = ("host", "port", "transport")
+
+
+def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge override into base without mutating either.
+
+    Args:
+        base: Base configuration data
+        override: Values taking precedence over base
+
+    Returns:
+        Merged configuration data
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = _deep_merge(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _nest_overrides(overrides: dict[str, Any]) -> dict[str, Any]:
+    """Move flat CLI server overrides into the nested server section.
+
+    Args:
+        overrides: Override values, flat server keys or nested sections
+
+    Returns:
+        Overrides shaped like configuration data
+    """
+    nested = {k: v for k, v in overrides.items() if k not in _SERVER_OVERRIDE_KEYS}
+    server = {k: overrides[k] for k in _SERVER_OVERRIDE_KEYS if k in overrides}
+    if server:
+        nested = _deep_merge(nested, {"server": server})
+    return nested
+
+
 class AIMCPConfig(BaseSettings):
     """Main AIMCP configuration with file and environment support."""
 
@@ -143,7 +238,7 @@ class AIMCPConfig(BaseSettings):
         case_sensitive=False,
         yaml_file="config.yaml",
         yaml_file_encoding="utf-8",
-        validate_assignment=True,
+        frozen=True,
     )
 
     server: ServerConfig = Field(default_factory=ServerConfig)
@@ -170,25 +265,106 @@ class AIMCPConfig(BaseSettings):
             yaml.YAMLError: If config file is invalid YAML
             ValidationError: If configuration is invalid
         """
+        return cls.model_validate(cls._read_yaml_file(file_path, overrides))
+
+    @classmethod
+    def from_trusted_yaml_file(
+        cls, file_path: Path, overrides: dict[str, Any] | None = None
+    ) -> "AIMCPConfig":
+        """Create configuration from a previously validated YAML file.
+
+        Skips field validation by building every section with
+        ``model_construct``. Environment variables are not applied, so this
+        is only suitable for config files already checked with
+        ``validate-config``.
+
+        Args:
+            file_path: Path to YAML configuration file
+            overrides: Optional dictionary of override values
+
+        Returns:
+            Unvalidated configuration instance
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            yaml.YAMLError: If config file is invalid YAML
+            KeyError: If the required gitlab section is missing
+            ValueError: If the GitLab instance URL or token is invalid
+        """
+        file_data = cls._read_yaml_file(file_path, overrides)
+
+        server_data = dict(file_data.get("server", {}))
+        if "transport" in server_data:
+            server_data["transport"] = TransportType(server_data["transport"])
+
+        # Normalise the GitLab fields callers rely on as validation would
+        gitlab_data = dict(file_data["gitlab"])
+        gitlab_data["instance_url"] = HttpUrl(gitlab_data["instance_url"])
+        gitlab_data["token"] = gitlab_data["token"].strip()
+        if not gitlab_data["token"]:
+            raise ValueError("GitLab token is required and cannot be empty")
+        gitlab_data["repositories"] = [
+            GitLabRepository.model_construct(**{**repo, "url": repo["url"].strip("/")})
+            for repo in gitlab_data.get("repositories", [])
+        ]
+
+        cache_data = dict(file_data.get("cache", {}))
+        if "backend" in cache_data:
+            cache_data["backend"] = CacheBackend(cache_data["backend"])
+        if cache_data.get("storage_path"):
+            cache_data["storage_path"] = Path(cache_data["storage_path"])
+
+        logging_data = dict(file_data.get("logging", {}))
+        if "level" in logging_data:
+            logging_data["level"] = LogLevel(logging_data["level"])
+
+        return cls.model_construct(
+            server=ServerConfig.model_construct(**server_data),
+            gitlab=GitLabConfig.model_construct(**gitlab_data),
+            cache=CacheConfig.model_construct(**cache_data),
+            logging=LoggingConfig.model_construct(**logging_data),
+            tools=ToolConfig.model_construct(**file_data.get("tools", {})),
+        )
+
+    @staticmethod
+    def _read_yaml_file(
+        file_path: Path, overrides: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Read raw configuration data from YAML file and apply overrides.
+
+        Files with a ``.json`` suffix are parsed with orjson instead of the
+        YAML parser.
+
+        Args:
+            file_path: Path to YAML (or JSON) configuration file
+            overrides: Optional dictionary of override values
+
+        Returns:
+            Raw configuration data
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            yaml.YAMLError: If config file is invalid YAML
+            orjson.JSONDecodeError: If JSON config file is invalid
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
-        try:
-            with file_path.open("r", encoding="utf-8") as f:
-                file_data = yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Invalid YAML in config file {file_path}: {e}")
+        file_data: dict[str, Any]
+        if file_path.suffix.lower() == ".json":
+            file_data = orjson.loads(file_path.read_bytes()) or {}
+        else:
+            try:
+                with file_path.open("r", encoding="utf-8") as f:
+                    file_data = yaml.load(f, Loader=_YAMLLoader) or {}
+            except yaml.YAMLError as e:
+                raise yaml.YAMLError(f"Invalid YAML in config file {file_path}: {e}")
 
         # Apply overrides if provided
         if overrides:
-            # Apply server overrides
-            if any(k in overrides for k in ["host", "port", "transport"]):
-                server_data = file_data.setdefault("server", {})
-                for key in ["host", "port", "transport"]:
-                    if key in overrides:
-                        server_data[key] = overrides[key]
+            return _deep_merge(file_data, _nest_overrides(overrides))
 
-        return cls.model_validate(file_data)
+        return file_data
 
     @classmethod
     def create(
@@ -208,6 +384,5 @@ class AIMCPConfig(BaseSettings):
         if config_path:
             return cls.from_yaml_file(config_path, overrides)
         else:
-            # Load from environment variables only
-            config_data = overrides or {}
-            return cls.model_validate(config_data)
+            # Load from environment variables; overrides take precedence
+            return cls(**_nest_overrides(overrides or {}))
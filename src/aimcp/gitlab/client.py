@@ -1,26 +1,167 @@
 """Async GitLab API client."""
 
 import asyncio
-import base64
 import fnmatch
+import functools
+import importlib.util
+import random
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
 from urllib.parse import quote
 
 import httpx
+import orjson
 from httpx import AsyncClient, Response
 
 from ..config.models import GitLabConfig, GitLabRepository
-from ..utils.logging import get_logger
+from ..utils.logging import get_logger, is_debug_enabled
 from .models import (
     GitLabBranch,
     GitLabError,
     GitLabFile,
     GitLabFileContent,
+    GitLabProbeResult,
     GitLabProject,
     GitLabTree,
 )
 
 logger = get_logger("gitlab")
 
+# Entries requested per page of a repository tree listing (GitLab maximum)
+_TREE_PAGE_SIZE = 100
+
+# Upper bound in seconds for a single retry wait
+_MAX_RETRY_WAIT = 60.0
+
+# Seconds project metadata is reused before it is fetched again
+_PROJECT_TTL_SECONDS = 300.0
+
+# Raw files kept for ETag revalidation; least recently used ones are dropped
+_ETAG_CACHE_MAX_ENTRIES = 256
+
+# Characters that start a glob wildcard in fnmatch patterns
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def _json(response: Response) -> Any:
+    """Decode a JSON response body with orjson.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Decoded JSON data
+    """
+    return orjson.loads(response.content)
+
+
+def _error_message(response: Response) -> str:
+    """Extract an error message from a failed GitLab response.
+
+    Only JSON bodies are parsed; HTML error pages from proxies and
+    gateways are reported by status alone.
+
+    Args:
+        response: HTTP error response
+
+    Returns:
+        Error message
+    """
+    content_type = response.headers.get("content-type", "")
+    if not content_type.startswith("application/json"):
+        return f"HTTP {response.status_code}: {response.reason_phrase}"
+
+    try:
+        return GitLabError(**_json(response)).message
+    except (TypeError, ValueError):
+        return f"HTTP {response.status_code}: {response.text}"
+
+
+def _retry_wait(attempt: int, retry_after: str | None = None) -> float:
+    """Get jittered wait time before retrying a request.
+
+    Args:
+        attempt: Zero-based attempt number
+        retry_after: Optional Retry-After header value in seconds
+
+    Returns:
+        Seconds to wait
+    """
+    wait = float(2**attempt)
+    if retry_after:
+        try:
+            wait = float(retry_after)
+        except ValueError:
+            pass  # HTTP-date form; keep exponential backoff
+
+    # Jitter keeps concurrent requests from retrying in lockstep
+    return min(wait, _MAX_RETRY_WAIT) + random.random()
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_path(path: str) -> str:
+    """URL-encode a project or file path as a single path segment.
+
+    Args:
+        path: Project or file path
+
+    Returns:
+        Encoded path
+    """
+    return quote(path, safe="")
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[frozenset[str], re.Pattern[str] | None]:
+    """Compile glob patterns for matching each path once.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Literal paths matched by equality, and one alternation regex for the
+        wildcard patterns (None if there are none)
+    """
+    literals = frozenset(p for p in patterns if not _GLOB_CHARS.search(p))
+    wildcards = [p for p in patterns if p not in literals]
+    if not wildcards:
+        return literals, None
+
+    regex = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in wildcards))
+    return literals, regex
+
+
+def _tree_roots(patterns: list[str]) -> list[str]:
+    """Get the directories that contain every possible match of the patterns.
+
+    Each pattern is anchored under the directory part of its literal prefix
+    (``rules/**/*.md`` under ``rules``). Nested directories are collapsed
+    into their parent.
+
+    Args:
+        patterns: List of glob patterns
+
+    Returns:
+        Sorted directories to list, or ``[""]`` if the whole tree is needed
+    """
+    directories = sorted(
+        {_GLOB_CHARS.split(pattern, 1)[0].rpartition("/")[0] for pattern in patterns}
+    )
+    if not directories or directories[0] == "":
+        return [""]
+
+    roots: list[str] = []
+    for directory in directories:
+        if roots and directory.startswith(roots[-1] + "/"):
+            continue
+        roots.append(directory)
+    return roots
+
 
 class GitLabClientError(Exception):
     """GitLab client error."""
@@ -42,10 +183,29 @@ class GitLabClient:
         self.config = config
         self.base_url = str(config.instance_url).rstrip("/")
         self.api_url = f"{self.base_url}/api/v4"
+        self.graphql_url = f"{self.base_url}/api/graphql"
 
-        # HTTP client configuration
+        # Last ETag and raw content per (project, file, ref) for conditional GETs,
+        # in least-recently-used order and capped at _ETAG_CACHE_MAX_ENTRIES
+        self._etag_cache: OrderedDict[tuple[str, str, str], tuple[str, bytes]] = (
+            OrderedDict()
+        )
+
+        # Project metadata per project path with the monotonic time it was fetched
+        self._project_cache: dict[str, tuple[float, GitLabProject]] = {}
+
+        # Requests currently in flight, shared by identical concurrent calls
+        self._inflight: dict[tuple[str, ...], asyncio.Future[Any]] = {}
+
+        # HTTP client configuration; HTTP/2 lets concurrent requests share
+        # one connection and is used whenever the h2 package is installed
         self.client = AsyncClient(
             timeout=config.timeout,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=max(1, config.max_connections // 2),
+            ),
             headers={
                 "Private-Token": config.token,
                 "User-Agent": "AIMCP/0.1.0",
@@ -68,7 +228,7 @@ class GitLabClient:
         self,
         method: str,
         endpoint: str,
-        **kwargs,  # type: ignore
+        **kwargs: Any,
     ) -> Response:
         """Make HTTP request to GitLab API.
 
@@ -84,18 +244,45 @@ class GitLabClient:
             GitLabClientError: If request fails
         """
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        return await self._send(method, url, **kwargs)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> Response:
+        """Send HTTP request with retries.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            **kwargs: Additional request parameters
+
+        Returns:
+            HTTP response
 
+        Raises:
+            GitLabClientError: If request fails
+        """
+        debug = is_debug_enabled("gitlab")
         for attempt in range(self.config.max_retries + 1):
             try:
-                logger.debug(
-                    "Making GitLab API request", method=method, url=url, attempt=attempt
-                )
+                if debug:
+                    logger.debug(
+                        "Making GitLab API request",
+                        method=method,
+                        url=url,
+                        attempt=attempt,
+                    )
 
                 response = await self.client.request(method, url, **kwargs)
 
                 if response.status_code == 429:  # Rate limit
                     if attempt < self.config.max_retries:
-                        wait_time = 2**attempt
+                        wait_time = _retry_wait(
+                            attempt, response.headers.get("Retry-After")
+                        )
                         logger.warning(
                             "Rate limited, retrying",
                             wait_time=wait_time,
@@ -105,23 +292,20 @@ class GitLabClient:
                         continue
 
                 if response.status_code >= 400:
-                    try:
-                        error_data = response.json()
-                        error = GitLabError(**error_data)
-                        message = error.message
-                    except Exception:
-                        message = f"HTTP {response.status_code}: {response.text}"
-
-                    raise GitLabClientError(message, response.status_code)
+                    raise GitLabClientError(
+                        _error_message(response), response.status_code
+                    )
 
-                logger.debug(
-                    "GitLab API request successful", status_code=response.status_code
-                )
+                if debug:
+                    logger.debug(
+                        "GitLab API request successful",
+                        status_code=response.status_code,
+                    )
                 return response
 
             except httpx.RequestError as e:
                 if attempt < self.config.max_retries:
-                    wait_time = 2**attempt
+                    wait_time = _retry_wait(attempt)
                     logger.warning(
                         "Request failed, retrying",
                         error=str(e),
@@ -134,6 +318,27 @@ class GitLabClient:
 
         raise GitLabClientError("Max retries exceeded")
 
+    async def _coalesce[T](
+        self, key: tuple[str, ...], factory: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run a request once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the request
+            factory: Function starting the request
+
+        Returns:
+            Request result
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so a cancelled caller does not cancel the request for others
+        return await asyncio.shield(future)
+
     async def get_project(self, project_path: str) -> GitLabProject:
         """Get project information.
 
@@ -143,9 +348,22 @@ class GitLabClient:
         Returns:
             Project information
         """
-        encoded_path = quote(project_path, safe="")
+        # Project metadata rarely changes; reuse it for a while
+        cached = self._project_cache.get(project_path)
+        if cached is not None and time.monotonic() - cached[0] < _PROJECT_TTL_SECONDS:
+            return cached[1]
+
+        project = await self._coalesce(
+            ("project", project_path), lambda: self._fetch_project(project_path)
+        )
+        self._project_cache[project_path] = (time.monotonic(), project)
+        return project
+
+    async def _fetch_project(self, project_path: str) -> GitLabProject:
+        """Fetch project information."""
+        encoded_path = _encode_path(project_path)
         response = await self._make_request("GET", f"/projects/{encoded_path}")
-        return GitLabProject(**response.json())
+        return GitLabProject(**_json(response))
 
     async def get_branches(self, project_path: str) -> list[GitLabBranch]:
         """Get project branches.
@@ -156,11 +374,11 @@ class GitLabClient:
         Returns:
             List of branches
         """
-        encoded_path = quote(project_path, safe="")
+        encoded_path = _encode_path(project_path)
         response = await self._make_request(
             "GET", f"/projects/{encoded_path}/repository/branches"
         )
-        return [GitLabBranch(**branch) for branch in response.json()]
+        return [GitLabBranch(**branch) for branch in _json(response)]
 
     async def get_tree(
         self,
@@ -180,8 +398,43 @@ class GitLabClient:
         Returns:
             List of tree entries
         """
-        encoded_path = quote(project_path, safe="")
-        params = {"ref": ref}
+        return await self._coalesce(
+            ("tree", project_path, ref, path, str(recursive)),
+            lambda: self._fetch_tree(project_path, ref, path, recursive),
+        )
+
+    async def _fetch_tree(
+        self, project_path: str, ref: str, path: str, recursive: bool
+    ) -> list[GitLabTree]:
+        """Fetch all pages of a repository tree listing."""
+        entries: list[GitLabTree] = []
+        async for page in self._iter_tree_pages(project_path, ref, path, recursive):
+            entries.extend(GitLabTree(**entry) for entry in page)
+        return entries
+
+    async def _iter_tree_pages(
+        self,
+        project_path: str,
+        ref: str,
+        path: str,
+        recursive: bool,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Iterate pages of a repository tree listing.
+
+        Follows the ``Link: rel="next"`` header, fetching the next page while
+        the caller processes the current one.
+
+        Args:
+            project_path: Project path
+            ref: Git reference (branch, tag, commit)
+            path: Path within repository
+            recursive: Whether to get recursive listing
+
+        Yields:
+            Raw tree entries of each page
+        """
+        encoded_path = _encode_path(project_path)
+        params = {"ref": ref, "per_page": str(_TREE_PAGE_SIZE)}
         if path:
             params["path"] = path
         if recursive:
@@ -192,7 +445,23 @@ class GitLabClient:
             f"/projects/{encoded_path}/repository/tree",
             params=params,
         )
-        return [GitLabTree(**entry) for entry in response.json()]
+
+        while True:
+            next_url = response.links.get("next", {}).get("url")
+            next_page = (
+                asyncio.create_task(self._send("GET", next_url)) if next_url else None
+            )
+
+            try:
+                yield _json(response)
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            if next_page is None:
+                return
+            response = await next_page
 
     async def get_file(
         self,
@@ -210,8 +479,8 @@ class GitLabClient:
         Returns:
             File content
         """
-        encoded_path = quote(project_path, safe="")
-        encoded_file_path = quote(file_path, safe="")
+        encoded_path = _encode_path(project_path)
+        encoded_file_path = _encode_path(file_path)
         params = {"ref": ref}
 
         response = await self._make_request(
@@ -219,7 +488,64 @@ class GitLabClient:
             f"/projects/{encoded_path}/repository/files/{encoded_file_path}",
             params=params,
         )
-        return GitLabFileContent(**response.json())
+        return GitLabFileContent(**_json(response))
+
+    async def get_file_raw(
+        self,
+        project_path: str,
+        file_path: str,
+        ref: str = "main",
+    ) -> bytes:
+        """Get raw file bytes without the JSON/base64 envelope.
+
+        Files fetched before are revalidated with ``If-None-Match``; an
+        unchanged file is answered with 304 and served from memory.
+
+        Args:
+            project_path: Project path
+            file_path: File path within repository
+            ref: Git reference
+
+        Returns:
+            Raw file content
+        """
+        return await self._coalesce(
+            ("raw", project_path, file_path, ref),
+            lambda: self._fetch_file_raw(project_path, file_path, ref),
+        )
+
+    async def _fetch_file_raw(
+        self, project_path: str, file_path: str, ref: str
+    ) -> bytes:
+        """Fetch raw file bytes, revalidating with a stored ETag."""
+        encoded_path = _encode_path(project_path)
+        encoded_file_path = _encode_path(file_path)
+        params = {"ref": ref}
+
+        # Revalidate a previously fetched file instead of downloading it again
+        cache_key = (project_path, file_path, ref)
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = await self._make_request(
+            "GET",
+            f"/projects/{encoded_path}/repository/files/{encoded_file_path}/raw",
+            params=params,
+            headers=headers,
+        )
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(cache_key)
+            return cached[1]
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, response.content)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > _ETAG_CACHE_MAX_ENTRIES:
+                self._etag_cache.popitem(last=False)
+        else:
+            self._etag_cache.pop(cache_key, None)
+        return response.content
 
     async def get_file_content_decoded(
         self,
@@ -229,6 +555,9 @@ class GitLabClient:
     ) -> str:
         """Get file content decoded as string.
 
+        Uses the raw file endpoint, so no base64 payload is transferred or
+        decoded.
+
         Args:
             project_path: Project path
             file_path: File path within repository
@@ -237,14 +566,9 @@ class GitLabClient:
         Returns:
             Decoded file content
         """
-        file_info = await self.get_file(project_path, file_path, ref)
-
-        if file_info.encoding == "base64":
-            content_bytes = base64.b64decode(file_info.content)
-            return content_bytes.decode("utf-8")
-        else:
-            # Assume text content
-            return file_info.content
+        content = await self.get_file_raw(project_path, file_path, ref)
+        # Decode explicitly rather than relying on httpx charset detection
+        return content.decode("utf-8")
 
     async def find_files_by_pattern(
         self,
@@ -264,26 +588,41 @@ class GitLabClient:
         Returns:
             List of matching files
         """
-        # Get recursive tree listing
-        tree_entries = await self.get_tree(project_path, ref, path, recursive=True)
-
-        matching_files = []
-        for entry in tree_entries:
-            if entry.type != "blob":  # Only files, not directories
-                continue
+        literals, regex = _compile_patterns(tuple(patterns))
 
-            # Check if file matches any pattern
-            for pattern in patterns:
-                if fnmatch.fnmatch(entry.path, pattern):
-                    file_info = GitLabFile(
-                        id=entry.id,
-                        name=entry.name,
-                        path=entry.path,
-                        type=entry.type,
-                        mode=entry.mode,
+        if path:
+            matching_files = await self._find_in_subtree(
+                project_path, ref, path, literals, regex, missing_ok=False
+            )
+        else:
+            # Look literal paths up directly; list only the subtrees the
+            # wildcard patterns can match in
+            wildcards = [p for p in patterns if p not in literals]
+            roots = _tree_roots(wildcards) if wildcards else []
+            probes = asyncio.gather(
+                *(self._probe_file(project_path, p, ref) for p in sorted(literals))
+            )
+            listings = asyncio.gather(
+                *(
+                    self._find_in_subtree(
+                        project_path,
+                        ref,
+                        root,
+                        frozenset(),
+                        regex,
+                        missing_ok=root != "",
                     )
-                    matching_files.append(file_info)
-                    break
+                    for root in roots
+                )
+            )
+            found, results = await asyncio.gather(probes, listings)
+            matching_files = [file_info for file_info in found if file_info]
+
+            # A literal path may also match a wildcard pattern
+            seen = {file_info.path for file_info in matching_files}
+            matching_files.extend(
+                f for files in results for f in files if f.path not in seen
+            )
 
         logger.info(
             "Found matching files",
@@ -294,6 +633,106 @@ class GitLabClient:
 
         return matching_files
 
+    async def _probe_file(
+        self, project_path: str, file_path: str, ref: str
+    ) -> GitLabFile | None:
+        """Get file metadata with a HEAD request, without its content.
+
+        Args:
+            project_path: Project path
+            file_path: File path within repository
+            ref: Git reference
+
+        Returns:
+            File information, or None if the file does not exist
+        """
+        encoded_path = _encode_path(project_path)
+        encoded_file_path = _encode_path(file_path)
+
+        try:
+            response = await self._make_request(
+                "HEAD",
+                f"/projects/{encoded_path}/repository/files/{encoded_file_path}",
+                params={"ref": ref},
+            )
+        except GitLabClientError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
+        headers = response.headers
+        blob_id = headers.get("X-Gitlab-Blob-Id")
+        if blob_id is None:
+            # Some proxies and older GitLab versions strip the metadata
+            # headers from HEAD responses; read them from a full GET instead
+            file = await self.get_file(project_path, file_path, ref)
+            return GitLabFile(
+                id=file.blob_id,
+                name=file.file_name,
+                path=file_path,
+                type="blob",
+                mode="100644",
+                size=file.size,
+                last_commit_id=file.last_commit_id,
+            )
+
+        size = headers.get("X-Gitlab-Size")
+        return GitLabFile(
+            id=blob_id,
+            name=headers.get("X-Gitlab-File-Name", file_path.rpartition("/")[2]),
+            path=file_path,
+            type="blob",
+            mode="100644",  # Not reported in HEAD metadata; assume a regular file
+            size=int(size) if size else None,
+            last_commit_id=headers.get("X-Gitlab-Last-Commit-Id"),
+        )
+
+    async def _find_in_subtree(
+        self,
+        project_path: str,
+        ref: str,
+        path: str,
+        literals: frozenset[str],
+        regex: re.Pattern[str] | None,
+        *,
+        missing_ok: bool,
+    ) -> list[GitLabFile]:
+        """Match files of a subtree page by page as the listing arrives.
+
+        Args:
+            project_path: Project path
+            ref: Git reference
+            path: Directory within repository ("" for the whole tree)
+            literals: Literal file paths to match
+            regex: Compiled wildcard patterns, if any
+            missing_ok: Treat a missing directory as having no matches
+
+        Returns:
+            List of matching files
+        """
+        matching_files: list[GitLabFile] = []
+        try:
+            async for page in self._iter_tree_pages(
+                project_path, ref, path, recursive=True
+            ):
+                # Filter raw entries; only matches are validated into models
+                for entry in page:
+                    if entry["type"] != "blob":  # Only files, not directories
+                        continue
+
+                    # Check if file matches any pattern
+                    entry_path = entry["path"]
+                    if entry_path in literals or (
+                        regex is not None and regex.match(entry_path)
+                    ):
+                        matching_files.append(GitLabFile.model_validate(entry))
+        except GitLabClientError as e:
+            if missing_ok and e.status_code == 404:
+                return []
+            raise
+
+        return matching_files
+
     async def check_tools_json_exists(self, repository: GitLabRepository) -> bool:
         """Check if tools.json exists in a repository.
 
@@ -351,6 +790,88 @@ class GitLabClient:
             )
             raise
 
+    async def batch_probe(
+        self, repositories: list[GitLabRepository]
+    ) -> list[GitLabProbeResult]:
+        """Probe project access and tools.json presence with one GraphQL query.
+
+        Args:
+            repositories: Repositories to probe
+
+        Returns:
+            Probe results in the same order as ``repositories``
+
+        Raises:
+            GitLabClientError: If the GraphQL request fails
+        """
+        if not repositories:
+            return []
+
+        variable_defs: list[str] = []
+        fields: list[str] = []
+        variables: dict[str, str] = {}
+        for index, repo in enumerate(repositories):
+            variable_defs.append(f"$path{index}: ID!, $ref{index}: String")
+            fields.append(
+                f"p{index}: project(fullPath: $path{index}) {{ name repository {{ "
+                f'blobs(paths: ["tools.json"], ref: $ref{index}) '
+                "{ nodes { size } } } }"
+            )
+            variables[f"path{index}"] = repo.url
+            variables[f"ref{index}"] = repo.branch
+
+        query = f"query({', '.join(variable_defs)}) {{ {' '.join(fields)} }}"
+        response = await self._send(
+            "POST",
+            self.graphql_url,
+            json={"query": query, "variables": variables},
+        )
+        try:
+            return self._parse_probe_payload(repositories, _json(response))
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+            raise GitLabClientError(f"Malformed GraphQL response: {e}") from e
+
+    def _parse_probe_payload(
+        self, repositories: list[GitLabRepository], payload: Any
+    ) -> list[GitLabProbeResult]:
+        """Build probe results from a decoded GraphQL payload."""
+        if not isinstance(payload, dict):
+            raise TypeError(f"expected an object, got {type(payload).__name__}")
+
+        data = payload.get("data")
+        if not data:
+            errors = payload.get("errors") or [{}]
+            raise GitLabClientError(
+                f"GraphQL query failed: {errors[0].get('message', 'no data')}"
+            )
+
+        results = []
+        for index, repo in enumerate(repositories):
+            project = data.get(f"p{index}")
+            if project is None:
+                results.append(
+                    GitLabProbeResult(
+                        repository=repo.url,
+                        branch=repo.branch,
+                        error="Project not found or not accessible",
+                    )
+                )
+                continue
+
+            blobs = (project.get("repository") or {}).get("blobs") or {}
+            nodes = blobs.get("nodes") or []
+            results.append(
+                GitLabProbeResult(
+                    repository=repo.url,
+                    branch=repo.branch,
+                    project_name=project["name"],
+                    tools_json_size=int(nodes[0]["size"]) if nodes else None,
+                )
+            )
+
+        logger.debug("Batch probed repositories", count=len(results))
+        return results
+
     async def test_connection(self) -> dict[str, str]:
         """Test GitLab API connection.
 
@@ -360,7 +881,7 @@ class GitLabClient:
         try:
             # Test API connectivity with user info
             response = await self._make_request("GET", "/user")
-            user_data = response.json()
+            user_data = _json(response)
 
             return {
                 "status": "success",
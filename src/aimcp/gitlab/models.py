@@ -8,6 +8,8 @@ from pydantic import BaseModel
 class GitLabFile(BaseModel):
     """GitLab repository file information."""
 
+    model_config = {"frozen": True}
+
     id: str
     name: str
     path: str
@@ -20,6 +22,8 @@ class GitLabFile(BaseModel):
 class GitLabFileContent(BaseModel):
     """GitLab file content response."""
 
+    model_config = {"frozen": True}
+
     file_name: str
     file_path: str
     size: int
@@ -35,6 +39,8 @@ class GitLabFileContent(BaseModel):
 class GitLabCommit(BaseModel):
     """GitLab commit information."""
 
+    model_config = {"frozen": True}
+
     id: str
     short_id: str
     title: str
@@ -51,6 +57,8 @@ class GitLabCommit(BaseModel):
 class GitLabProject(BaseModel):
     """GitLab project information."""
 
+    model_config = {"frozen": True}
+
     id: int
     name: str
     path: str
@@ -67,6 +75,8 @@ class GitLabProject(BaseModel):
 class GitLabBranch(BaseModel):
     """GitLab branch information."""
 
+    model_config = {"frozen": True}
+
     name: str
     merged: bool
     protected: bool
@@ -80,6 +90,8 @@ class GitLabBranch(BaseModel):
 class GitLabTree(BaseModel):
     """GitLab repository tree (directory listing)."""
 
+    model_config = {"frozen": True}
+
     id: str
     name: str
     path: str
@@ -87,9 +99,23 @@ class GitLabTree(BaseModel):
     mode: str
 
 
+class GitLabProbeResult(BaseModel):
+    """Repository probe result from a batched GraphQL query."""
+
+    model_config = {"frozen": True}
+
+    repository: str
+    branch: str
+    project_name: str | None = None
+    tools_json_size: int | None = None
+    error: str | None = None
+
+
 class GitLabError(BaseModel):
     """GitLab API error response."""
 
+    model_config = {"frozen": True}
+
     message: str
     error: str | None = None
     error_description: str | None = None
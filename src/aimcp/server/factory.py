@@ -1,6 +1,7 @@
 """Server factory for creating MCP server instances."""
 
-from typing import Awaitable, Callable
+from collections.abc import Callable, Coroutine
+from typing import Any
 
 from ..cache.factory import create_cache_manager
 from ..config.models import AIMCPConfig
@@ -44,7 +45,9 @@ async def create_mcp_server(config: AIMCPConfig) -> MCPServer:
     return mcp_server
 
 
-async def create_server_runner(config: AIMCPConfig) -> Callable[[], Awaitable[None]]:
+async def create_server_runner(
+    config: AIMCPConfig,
+) -> Callable[[], Coroutine[Any, Any, None]]:
     """Create MCP server and return runner coroutine.
     
     Args:
@@ -1,9 +1,11 @@
 """FastMCP server implementation."""
 
 import asyncio
-from dataclasses import dataclass
+from collections import Counter
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
 from functools import partial
-from typing import Any, Awaitable, Callable
+from typing import Any
 
 from fastmcp import FastMCP
 
@@ -11,11 +13,16 @@ from ..cache.manager import CacheManager
 from ..config.models import AIMCPConfig
 from ..gitlab.client import GitLabClient
 from ..tools.manager import ToolManager
-from ..tools.models import ConflictResolutionStrategy
-from ..utils.logging import get_logger
+from ..tools.models import ConflictResolutionStrategy, MCPResource, ResolvedTool
+from ..utils.logging import get_logger, is_debug_enabled
 
 logger = get_logger("mcp.server")
 
+# Text formats that are small and important enough to inline with tool results
+_AUTO_LOAD_MIME_TYPES = frozenset(
+    {"text/markdown", "text/plain", "application/json", "text/yaml"}
+)
+
 
 @dataclass(slots=True)
 class MCPServer:
@@ -25,7 +32,8 @@ class MCPServer:
     cache_manager: CacheManager
     gitlab_client: GitLabClient
     tool_manager: ToolManager
-    _server: FastMCP | None = None
+    _server: FastMCP = field(init=False)
+    _tools_loaded: bool = False
 
     def __post_init__(self) -> None:
         """Initialize FastMCP server."""
@@ -49,20 +57,18 @@ class MCPServer:
 
         logger.info("MCP server initialized", name=self.config.server.name)
 
-    async def get_server_runner(self) -> Callable[[], Awaitable[None]]:
+    async def get_server_runner(self) -> Callable[[], Coroutine[Any, Any, None]]:
         """Get server runner coroutine for the configured transport.
         
         Returns:
             Async callable that runs the server with configured transport
         """
-        if not self._server:
-            raise RuntimeError("Server not initialized")
-
-        # Start cache manager
-        await self.cache_manager.start()
-
-        # Load and register tools
-        await self._load_and_register_tools()
+        # Start cache manager, then load and register tools; both happen
+        # once even if a runner is requested again
+        if not self._tools_loaded:
+            await self.cache_manager.start()
+            await self._load_and_register_tools()
+            self._tools_loaded = True
 
         # Return appropriate runner based on transport
         match self.config.server.transport:
@@ -92,15 +98,24 @@ class MCPServer:
         """Clean up server resources."""
         logger.info("Cleaning up MCP server resources")
 
-        # Stop cache manager
-        await self.cache_manager.stop()
-
-        # Close GitLab client
-        await self.gitlab_client.close()
+        # Stop cache manager and close GitLab client; the two are independent,
+        # and one failing must not keep the other from shutting down
+        results = await asyncio.gather(
+            self.cache_manager.stop(),
+            self.gitlab_client.close(),
+            return_exceptions=True,
+        )
+        for component, result in zip(("cache", "gitlab"), results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to clean up component",
+                    component=component,
+                    error=str(result),
+                )
 
         logger.info("MCP server cleanup completed")
 
-    async def __aenter__(self) -> Callable[[], Awaitable[None]]:
+    async def __aenter__(self) -> Callable[[], Coroutine[Any, Any, None]]:
         """Async context manager entry - returns server runner."""
         return await self.get_server_runner()
 
@@ -118,33 +133,67 @@ class MCPServer:
                 logger.warning("No tools loaded from any repository")
                 return
 
-            # Register each tool with FastMCP
+            # Register each tool with FastMCP; registration is synchronous
+            # bookkeeping, and one bad tool must not drop the rest
+            registered = 0
             for tool in resolved_tools:
-                await self._register_mcp_tool(tool)
+                try:
+                    self._register_mcp_tool(tool)
+                    registered += 1
+                except Exception as e:
+                    logger.error(
+                        "Failed to register tool",
+                        tool=tool.resolved_name,
+                        error=str(e),
+                    )
 
-            logger.info(
-                "Tools loaded and registered successfully", count=len(resolved_tools)
-            )
+            logger.info("Tools loaded and registered successfully", count=registered)
 
         except Exception as e:
             logger.error("Failed to load and register tools", error=str(e))
             # Continue startup even if tool loading fails
 
-    async def _register_mcp_tool(self, tool: Any) -> None:
+    def _register_mcp_tool(self, tool: ResolvedTool) -> None:
         """Register a single resolved tool with FastMCP.
 
         Args:
             tool: ResolvedTool instance to register
         """
-        from ..tools.models import ResolvedTool
+        # Tool output only depends on repository content, so repeated calls
+        # within the cache TTL reuse the previous result. Results are kept
+        # per repository so invalidating it drops them; merged tools span
+        # several repositories and are not memoized
+        repository = next(
+            (
+                repo
+                for repo in self.config.gitlab.repositories
+                if repo.url == tool.repository and repo.branch == tool.branch
+            ),
+            None,
+        )
 
-        if not isinstance(tool, ResolvedTool):
-            logger.error("Invalid tool type for registration", tool_type=type(tool))
-            return
+        # Resource URIs and auto-load decisions are fixed once the tool is
+        # registered; work them out here instead of on every call
+        uri_prefix = f"aimcp://{tool.repository}/{tool.branch}/"
+        resource_entries = [
+            (
+                resource,
+                uri_prefix + resource.uri,
+                self._should_auto_load_resource(resource),
+            )
+            for resource in tool.related_resources
+        ]
 
         # Create tool handler that provides structured resource information
         async def tool_handler() -> dict[str, Any]:
             """Handle tool execution by providing structured resource information."""
+            if repository is not None:
+                cached_result = await self.cache_manager.get_tool_result(
+                    repository, tool.resolved_name
+                )
+                if cached_result is not None:
+                    return cached_result
+
             result: dict[str, Any] = {
                 "tool": tool.resolved_name,
                 "repository": tool.repository,
@@ -153,10 +202,8 @@ class MCPServer:
             }
 
             # Add structured resource information
-            for resource in tool.related_resources:
-                # Generate URI from resource
-                uri = f"aimcp://{tool.repository}/{tool.branch}/{resource.uri}"
-                
+            auto_loads: list[tuple[dict[str, Any], str, Any]] = []
+            for resource, uri, auto_load in resource_entries:
                 resource_info = {
                     "name": resource.name,
                     "uri": uri,
@@ -166,33 +213,53 @@ class MCPServer:
                 
                 # For small/critical resources, include content directly
                 # For others, provide URI for on-demand loading with load-resource tool
-                try:
-                    should_auto_load = self._should_auto_load_resource(resource)
-                    if should_auto_load:
-                        content = await self.tool_manager.get_resource_content(uri)
-                        resource_info["content"] = content
-                        resource_info["loaded"] = True
-                    else:
-                        resource_info["loaded"] = False
-                        resource_info["load_hint"] = f"Use load-resource tool with URI: {uri}"
-                        
-                except Exception as e:
+                if auto_load:
+                    auto_loads.append((resource_info, uri, resource))
+                else:
+                    resource_info["loaded"] = False
+                    resource_info["load_hint"] = f"Use load-resource tool with URI: {uri}"
+                
+                result["resources"].append(resource_info)
+
+            # Fetch all auto-loaded resources concurrently
+            contents = await asyncio.gather(
+                *(
+                    self.tool_manager.get_resource_content(uri)
+                    for _, uri, _ in auto_loads
+                ),
+                return_exceptions=True,
+            )
+            for (resource_info, _, resource), content in zip(
+                auto_loads, contents, strict=True
+            ):
+                if isinstance(content, Exception):
                     logger.error(
                         "Failed to fetch resource content", 
                         resource=resource.name, 
-                        error=str(e)
+                        error=str(content)
                     )
-                    resource_info["error"] = str(e)
+                    resource_info["error"] = str(content)
                     resource_info["loaded"] = False
-                
-                result["resources"].append(resource_info)
+                elif isinstance(content, BaseException):
+                    raise content
+                else:
+                    resource_info["content"] = content
+                    resource_info["loaded"] = True
+
+            # Don't pin transient resource failures for the whole TTL
+            if repository is not None and not any(
+                "error" in info for info in result["resources"]
+            ):
+                await self.cache_manager.set_tool_result(
+                    repository,
+                    tool.resolved_name,
+                    result,
+                    self.config.cache.ttl_seconds,
+                )
 
             return result
 
         # Register with FastMCP using the tool decorator
-        if not self._server:
-            raise RuntimeError("Server not initialized")
-        
         self._server.tool(
             tool_handler,
             name=tool.resolved_name,
@@ -208,125 +275,134 @@ class MCPServer:
 
     async def _run_stdio(self) -> None:
         """Run server with STDIO transport."""
-        if not self._server:
-            raise RuntimeError("Server not initialized")
         await self._server.run_stdio_async()
 
     async def _run_http(self, host: str, port: int) -> None:
         """Run server with HTTP transport."""
-        if not self._server:
-            raise RuntimeError("Server not initialized")
         await self._server.run_http_async(host=host, port=port)
 
     async def _run_sse(self, host: str, port: int) -> None:
         """Run server with SSE transport."""
-        if not self._server:
-            raise RuntimeError("Server not initialized")
         await self._server.run_sse_async(host=host, port=port)
 
     @property
     def server(self) -> FastMCP:
         """Get the FastMCP server instance."""
-        if not self._server:
-            raise RuntimeError("Server not initialized")
         return self._server
 
     def _register_builtin_tools(self) -> None:
         """Register built-in tools."""
-        if not self._server:
-            raise RuntimeError("Server not initialized")
-
-        @self._server.tool(
+        self._server.tool(
             name="load-resource",
             description="Load content from a resource URI (aimcp://repo/branch/file)",
-        )
-        async def load_resource(uri: str) -> str:
-            """Load resource content by URI.
-            
-            Args:
-                uri: Resource URI in format aimcp://repo/branch/file
-                
-            Returns:
-                Resource content as string
-            """
-            try:
-                content = await self.tool_manager.get_resource_content(uri)
-                logger.debug("Resource loaded successfully", uri=uri, size=len(content))
-                return content
-            except Exception as e:
-                error_msg = f"Failed to load resource {uri}: {e}"
-                logger.error("Resource loading failed", uri=uri, error=str(e))
-                return error_msg
-
-        @self._server.tool(
+        )(self._tool_load_resource)
+        self._server.tool(
             name="discover-resources",
             description="Discover all available resources across all configured repositories",
-        )
-        async def discover_resources(repository_filter: str = "") -> dict[str, Any]:
-            """Discover available resources across repositories.
+        )(self._tool_discover_resources)
+
+        logger.debug("Built-in tools registered")
+
+    async def _tool_load_resource(self, uri: str) -> str:
+        """Load resource content by URI.
+        
+        Args:
+            uri: Resource URI in format aimcp://repo/branch/file
             
-            Args:
-                repository_filter: Optional filter to limit to specific repository
-                
-            Returns:
-                Dictionary with resource discovery information
-            """
-            try:
-                discovery_result = {
-                    "repositories": [],
-                    "total_resources": 0,
-                    "resource_summary": {}
+        Returns:
+            Resource content as string
+        """
+        try:
+            content = await self.tool_manager.get_resource_content(uri)
+            if is_debug_enabled("mcp.server"):
+                logger.debug(
+                    "Resource loaded successfully", uri=uri, size=len(content)
+                )
+            return content
+        except Exception as e:
+            error_msg = f"Failed to load resource {uri}: {e}"
+            logger.error("Resource loading failed", uri=uri, error=str(e))
+            return error_msg
+
+    async def _tool_discover_resources(
+        self, repository_filter: str = ""
+    ) -> dict[str, Any]:
+        """Discover available resources across repositories.
+        
+        Args:
+            repository_filter: Optional filter to limit to specific repository
+            
+        Returns:
+            Dictionary with resource discovery information
+        """
+        try:
+            discovery_result = {
+                "repositories": [],
+                "total_resources": 0,
+                "resource_summary": {}
+            }
+            
+            resource_summary: Counter[str] = Counter()
+
+            # Apply repository filter if provided
+            repositories = [
+                repo
+                for repo in self.config.gitlab.repositories
+                if not repository_filter or repository_filter in repo.url
+            ]
+
+            # Load tool specifications from all repositories concurrently
+            specs = await asyncio.gather(
+                *(
+                    self.tool_manager._load_repository_tools(repo)
+                    for repo in repositories
+                ),
+                return_exceptions=True,
+            )
+
+            for repo, spec in zip(repositories, specs, strict=True):
+                if isinstance(spec, BaseException):
+                    logger.error("Failed to discover resources from repository", 
+                               repository=repo.url, error=str(spec))
+                    continue
+                if not spec or not spec.resources:
+                    continue
+
+                repo_info = {
+                    "repository": repo.url,
+                    "branch": repo.branch,
+                    "resources": []
                 }
                 
-                # Load tool specifications from all repositories to get resources
-                for repo in self.config.gitlab.repositories:
-                    # Apply repository filter if provided
-                    if repository_filter and repository_filter not in repo.url:
-                        continue
-                        
-                    try:
-                        spec = await self.tool_manager._load_repository_tools(repo)
-                        if spec and spec.resources:
-                            repo_info = {
-                                "repository": repo.url,
-                                "branch": repo.branch,
-                                "resources": []
-                            }
-                            
-                            for resource in spec.resources:
-                                resource_info = {
-                                    "name": resource.name,
-                                    "uri": f"aimcp://{repo.url}/{repo.branch}/{resource.uri}",
-                                    "description": resource.description,
-                                    "mimeType": resource.mimeType,
-                                    "size": resource.size,
-                                }
-                                repo_info["resources"].append(resource_info)
-                                discovery_result["total_resources"] += 1
-                                
-                                # Track MIME types for summary
-                                mime_type = resource.mimeType or "unknown"
-                                discovery_result["resource_summary"][mime_type] = discovery_result["resource_summary"].get(mime_type, 0) + 1
-                            
-                            discovery_result["repositories"].append(repo_info)
-                            
-                    except Exception as e:
-                        logger.error("Failed to discover resources from repository", 
-                                   repository=repo.url, error=str(e))
-                        continue
-                
-                logger.debug("Resource discovery completed", 
-                           repositories=len(discovery_result["repositories"]),
-                           total_resources=discovery_result["total_resources"])
-                
-                return discovery_result
+                uri_prefix = f"aimcp://{repo.url}/{repo.branch}/"
+                for resource in spec.resources:
+                    resource_info = {
+                        "name": resource.name,
+                        "uri": uri_prefix + resource.uri,
+                        "description": resource.description,
+                        "mimeType": resource.mimeType,
+                        "size": resource.size,
+                    }
+                    repo_info["resources"].append(resource_info)
+                    discovery_result["total_resources"] += 1
+                    
+                    # Track MIME types for summary
+                    resource_summary[resource.mimeType or "unknown"] += 1
                 
-            except Exception as e:
-                error_msg = f"Resource discovery failed: {e}"
-                logger.error("Resource discovery failed", error=str(e))
-                return {"error": error_msg}
+                discovery_result["repositories"].append(repo_info)
+            
+            discovery_result["resource_summary"] = dict(resource_summary)
 
-        logger.debug("Built-in tools registered")
+            logger.debug("Resource discovery completed", 
+                       repositories=len(discovery_result["repositories"]),
+                       total_resources=discovery_result["total_resources"])
+            
+            return discovery_result
+            
+        except Exception as e:
+            error_msg = f"Resource discovery failed: {e}"
+            logger.error("Resource discovery failed", error=str(e))
+            return {"error": error_msg}
 
     def _should_auto_load_resource(self, resource) -> bool:
         """Determine if a resource should be auto-loaded with tool execution.
@@ -337,13 +413,15 @@ class MCPServer:
         Returns:
             True if resource should be loaded automatically
         """
-        from ..tools.models import MCPResource
-        
         if not isinstance(resource, MCPResource):
             return False
             
+        size = resource.size
+
+        tools_config = self.config.tools
+
         # Auto-load based on size (configurable threshold)
-        if resource.size and resource.size <= self.config.tools.max_auto_load_size:
+        if size and size <= tools_config.max_auto_load_size:
             return True
             
         # Auto-load based on priority annotation
@@ -352,8 +430,9 @@ class MCPServer:
                 return True
                 
         # Auto-load based on MIME type (text files are usually small and important)
-        auto_load_types = ['text/markdown', 'text/plain', 'application/json', 'text/yaml']
-        if resource.mimeType in auto_load_types and (not resource.size or resource.size <= 50000):  # 50KB for text
+        if resource.mimeType in _AUTO_LOAD_MIME_TYPES and (
+            not size or size <= tools_config.max_auto_load_text_size
+        ):
             return True
             
         return False
@@ -1,13 +1,22 @@
 """Tool specification manager."""
 
-import json
+import asyncio
+import time
+from functools import partial
 from typing import Any
 
+import orjson
+
 from ..cache.manager import CacheManager
 from ..config.models import AIMCPConfig, GitLabRepository
 from ..gitlab.client import GitLabClient, GitLabClientError
-from ..utils.logging import get_logger
-from .models import ConflictResolutionStrategy, ResolvedTool, ToolsSpecification
+from ..utils.logging import get_logger, is_debug_enabled
+from .models import (
+    ConflictResolutionStrategy,
+    MCPResource,
+    ResolvedTool,
+    ToolsSpecification,
+)
 from .resolver import ToolResolver
 
 logger = get_logger("tools.manager")
@@ -40,44 +49,69 @@ class ToolManager:
             ConflictResolutionStrategy.PREFIX
         )  # Default strategy
 
+        # Resource URI prefix ("<url>/<branch>/") -> (position, repository),
+        # keeping the first configured repository for each prefix
+        self._repositories_by_prefix: dict[str, tuple[int, GitLabRepository]] = {}
+        for position, repo in enumerate(config.gitlab.repositories):
+            self._repositories_by_prefix.setdefault(
+                f"{repo.url}/{repo.branch}/", (position, repo)
+            )
+
+        # Parsed specifications per (url, branch) with the monotonic time they
+        # were loaded and the tools.json bytes they were parsed from; hits skip
+        # the cache read and model validation, and unchanged bytes are not
+        # parsed again once the entry is stale
+        self._spec_cache: dict[
+            tuple[str, str], tuple[float, bytes, ToolsSpecification]
+        ] = {}
+
+        # Specification loads in flight, shared by concurrent callers
+        self._inflight: dict[
+            tuple[str, str], asyncio.Task[ToolsSpecification | None]
+        ] = {}
+
     async def load_all_tools(self) -> list[ResolvedTool]:
         """Load and resolve tools from all configured repositories.
 
         Returns:
             List of resolved tools ready for MCP registration
         """
-        logger.info(
-            "Loading tools from all repositories",
-            count=len(self.config.gitlab.repositories),
-        )
+        configured = self.config.gitlab.repositories
+        logger.info("Loading tools from all repositories", count=len(configured))
 
         # Load tool specifications from all repositories
+        # Repositories are fetched concurrently; results are collected in
+        # configuration order since resolution priority depends on it
         repo_tools: dict[GitLabRepository, ToolsSpecification] = {}
+        # Duplicate (url, branch) entries would only load the same spec twice
+        repositories = list(dict.fromkeys(configured))
+        results = await asyncio.gather(
+            *(self._load_repository_tools(repo) for repo in repositories),
+            return_exceptions=True,
+        )
 
-        for repo in self.config.gitlab.repositories:
-            try:
-                spec = await self._load_repository_tools(repo)
-                if spec:
-                    repo_tools[repo] = spec
-                    logger.debug(
-                        "Loaded tools from repository",
-                        repository=repo.url,
-                        tool_count=len(spec.tools),
-                    )
-                else:
-                    logger.warning(
-                        "Repository has no tools.json, skipping", repository=repo.url
-                    )
-
-            except Exception as e:
+        for repo, result in zip(repositories, results, strict=True):
+            if isinstance(result, BaseException):
                 logger.error(
                     "Failed to load tools from repository",
                     repository=repo.url,
-                    error=str(e),
+                    error=str(result),
                 )
                 # Continue with other repositories
                 continue
 
+            if result:
+                repo_tools[repo] = result
+                logger.debug(
+                    "Loaded tools from repository",
+                    repository=repo.url,
+                    tool_count=len(result.tools),
+                )
+            else:
+                logger.warning(
+                    "Repository has no tools.json, skipping", repository=repo.url
+                )
+
         if not repo_tools:
             logger.warning("No tool specifications loaded from any repository")
             return []
@@ -116,16 +150,38 @@ class ToolManager:
         Returns:
             Tool specification or None if tools.json not found
         """
+        spec_key = (repository.url, repository.branch)
+        cached = self._spec_cache.get(spec_key)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < self.config.cache.ttl_seconds
+        ):
+            return cached[2]
+
+        task = self._inflight.get(spec_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_repository_tools(repository))
+            self._inflight[spec_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(spec_key, None))
+
+        # Shield so a cancelled caller does not cancel the load for other waiters
+        return await asyncio.shield(task)
+
+    async def _fetch_repository_tools(
+        self, repository: GitLabRepository
+    ) -> ToolsSpecification | None:
+        """Load tool specification from the cache or GitLab."""
         cache_key = f"tools:{repository.url}:{repository.branch}"
 
-        # Try cache first
+        # Try cache first; the cache holds the raw tools.json bytes
         try:
             cached_spec = await self.cache_manager.get(cache_key)
             if cached_spec:
-                logger.debug(
-                    "Using cached tool specification", repository=repository.url
-                )
-                return ToolsSpecification(**cached_spec)
+                if is_debug_enabled("tools.manager"):
+                    logger.debug(
+                        "Using cached tool specification", repository=repository.url
+                    )
+                return self._parse_tools_json(repository, cached_spec)
         except Exception as e:
             logger.debug(
                 "Cache miss for tool specification",
@@ -135,7 +191,8 @@ class ToolManager:
 
         # Fetch from GitLab
         try:
-            content = await self.gitlab_client.get_file_content_decoded(
+            # Raw bytes go straight to the parser without a str round trip
+            content = await self.gitlab_client.get_file_raw(
                 repository.url,
                 "tools.json",
                 repository.branch,
@@ -143,13 +200,12 @@ class ToolManager:
 
             # Parse JSON
             try:
-                spec_data = json.loads(content)
-                spec = ToolsSpecification(**spec_data)
+                spec = self._parse_tools_json(repository, content)
 
-                # Cache for future use
+                # Cache the validated document as fetched; no model dump needed
                 await self.cache_manager.set(
                     cache_key,
-                    spec.model_dump(),
+                    content,
                     ttl=self.config.cache.ttl_seconds,
                 )
 
@@ -161,7 +217,7 @@ class ToolManager:
 
                 return spec
 
-            except (json.JSONDecodeError, ValueError) as e:
+            except (orjson.JSONDecodeError, ValueError) as e:
                 logger.error(
                     "Invalid tools.json format", repository=repository.url, error=str(e)
                 )
@@ -172,6 +228,7 @@ class ToolManager:
         except GitLabClientError as e:
             if e.status_code == 404:
                 # tools.json not found - this is expected for some repositories
+                self._spec_cache.pop((repository.url, repository.branch), None)
                 logger.debug(
                     "tools.json not found in repository", repository=repository.url
                 )
@@ -187,6 +244,30 @@ class ToolManager:
                     f"Failed to fetch tools.json from {repository.url}: {e}"
                 ) from e
 
+    def _parse_tools_json(
+        self, repository: GitLabRepository, content: bytes
+    ) -> ToolsSpecification:
+        """Parse tools.json and remember it with the bytes it came from.
+
+        Args:
+            repository: Repository configuration
+            content: Raw tools.json content
+
+        Returns:
+            Tool specification
+        """
+        spec_key = (repository.url, repository.branch)
+
+        # A stale entry whose file has not changed is renewed, not re-parsed
+        previous = self._spec_cache.get(spec_key)
+        if previous is not None and previous[1] == content:
+            spec = previous[2]
+        else:
+            spec = ToolsSpecification(**orjson.loads(content))
+
+        self._spec_cache[spec_key] = (time.monotonic(), content, spec)
+        return spec
+
     async def get_resource_content(self, resource_uri: str) -> str:
         """Fetch content for a resource URI.
 
@@ -212,63 +293,44 @@ class ToolManager:
             repository = None
             branch = None
             file_path = None
-            
-            for repo in self.config.gitlab.repositories:
-                # Check if URI starts with this repository URL and branch
-                expected_prefix = f"{repo.url}/{repo.branch}/"
-                if uri_parts.startswith(expected_prefix):
-                    repository = repo.url
-                    branch = repo.branch  
-                    file_path = uri_parts[len(expected_prefix):]
-                    break
-            
-            if not repository or not branch or not file_path:
-                raise ValueError("Could not parse repository, branch, and file path from URI")
 
-            # Find the repository config (we already validated it exists above)
-            repo_config = None
-            for repo in self.config.gitlab.repositories:
-                if repo.url == repository and repo.branch == branch:
-                    repo_config = repo
-                    break
+            repo_config = self._find_repository(uri_parts)
+            if repo_config:
+                repository = repo_config.url
+                branch = repo_config.branch
+                file_path = uri_parts[len(repository) + len(branch) + 2 :]
 
-            if not repo_config:
-                raise ToolSpecificationError(
-                    f"Repository {repository}:{branch} not in configuration"
-                )
+            if not repo_config or not repository or not branch or not file_path:
+                raise ValueError("Could not parse repository, branch, and file path from URI")
 
             # Check if file is in allowed resources
-            await self._validate_resource_access(repo_config, file_path)
-
-            # Fetch content
-            cache_key = f"resource:{repository}:{branch}:{file_path}"
+            resource = await self._validate_resource_access(repo_config, file_path)
 
-            # Try cache first
-            try:
-                cached_content = await self.cache_manager.get(cache_key)
-                if cached_content:
-                    logger.debug("Using cached resource content", uri=resource_uri)
-                    return cached_content
-            except Exception:
-                pass  # Cache miss, continue to fetch
-
-            # Fetch from GitLab
-            content = await self.gitlab_client.get_file_content_decoded(
-                repository, file_path, branch
-            )
+            # Refuse files the specification already declares as too large
+            max_size = self.config.tools.max_file_size
+            if resource.size is not None and resource.size > max_size:
+                raise ToolSpecificationError(
+                    f"Resource {file_path} exceeds maximum file size "
+                    f"({resource.size} > {max_size} bytes)"
+                )
 
-            # Cache content
-            await self.cache_manager.set(
-                cache_key,
-                content,
-                ttl=self.config.cache.ttl_seconds,
+            # Serve from cache, fetching from GitLab on a miss; resources are
+            # stored per file like rule files, so only this one entry is read
+            # and repository invalidation covers it. Concurrent misses for the
+            # same resource share one fetch
+            content = await self.cache_manager.get_or_fetch_rule_file(
+                repo_config,
+                file_path,
+                partial(self._fetch_resource, repo_config, file_path),
+                self.config.cache.ttl_seconds,
             )
 
-            logger.debug(
-                "Fetched and cached resource content",
-                uri=resource_uri,
-                size=len(content),
-            )
+            if is_debug_enabled("tools.manager"):
+                logger.debug(
+                    "Loaded resource content",
+                    uri=resource_uri,
+                    size=len(content),
+                )
 
             return content
 
@@ -281,15 +343,66 @@ class ToolManager:
                 f"Failed to fetch resource {resource_uri}: {e}"
             ) from e
 
+    def _find_repository(self, uri_path: str) -> GitLabRepository | None:
+        """Find the configured repository a resource URI path belongs to.
+
+        Args:
+            uri_path: Resource URI without the aimcp:// scheme
+
+        Returns:
+            Repository configuration or None if no repository matches
+        """
+        # Try each "/"-terminated prefix instead of scanning every repository;
+        # when prefixes overlap, the repository configured first wins
+        found: tuple[int, GitLabRepository] | None = None
+        end = uri_path.find("/")
+        while end != -1:
+            match = self._repositories_by_prefix.get(uri_path[: end + 1])
+            if match and (found is None or match[0] < found[0]):
+                found = match
+            end = uri_path.find("/", end + 1)
+        return found[1] if found else None
+
+    async def _fetch_resource(
+        self, repository: GitLabRepository, file_path: str
+    ) -> str:
+        """Fetch a resource file, refusing ones over tools.max_file_size.
+
+        Args:
+            repository: Repository configuration
+            file_path: File path within repository
+
+        Returns:
+            Decoded file content
+
+        Raises:
+            ToolSpecificationError: If the file exceeds the size limit
+        """
+        content = await self.gitlab_client.get_file_raw(
+            repository.url, file_path, repository.branch
+        )
+
+        # Checked on the fetched bytes too; resource.size is optional
+        max_size = self.config.tools.max_file_size
+        if len(content) > max_size:
+            raise ToolSpecificationError(
+                f"Resource {file_path} exceeds maximum file size "
+                f"({len(content)} > {max_size} bytes)"
+            )
+        return content.decode("utf-8")
+
     async def _validate_resource_access(
         self, repository: GitLabRepository, file_path: str
-    ) -> None:
+    ) -> MCPResource:
         """Validate that a file is allowed to be accessed.
 
         Args:
             repository: Repository configuration
             file_path: File path to validate
 
+        Returns:
+            Resource the file belongs to
+
         Raises:
             ToolSpecificationError: If file access is not allowed
         """
@@ -300,17 +413,17 @@ class ToolManager:
                 f"No tool specification found for repository {repository.url}"
             )
 
-        # Check if file is in the resources list
-        for resource in spec.resources:
-            # Check if the URI matches or if it's a relative path that matches
-            if resource.uri == file_path or resource.uri.endswith(f"/{file_path}"):
+        # Check if the path matches a resource URI or a relative path of one
+        resource = spec.resources_by_path.get(file_path)
+        if resource is not None:
+            if is_debug_enabled("tools.manager"):
                 logger.debug(
                     "Resource access validated",
                     repository=repository.url,
                     file_path=file_path,
                     resource_name=resource.name,
                 )
-                return
+            return resource
 
         # File not found in resources
         raise ToolSpecificationError(
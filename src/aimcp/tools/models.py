@@ -1,8 +1,9 @@
 """Tool specification models for AIMCP."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -54,7 +55,7 @@ class MCPTool(BaseModel):
     inputSchema: dict[str, Any] | None = None  # JSON Schema as dict
     outputSchema: dict[str, Any] | None = None  # JSON Schema as dict
     annotations: MCPToolAnnotations | None = None
-    resourceRefs: list[str] | None = None  # References to resources by name
+    resourceRefs: tuple[str, ...] | None = None  # References to resources by name
 
 
 class ToolsSpecification(BaseModel):
@@ -64,8 +65,26 @@ class ToolsSpecification(BaseModel):
     resources: list[MCPResource] = []  # Separate from tools per MCP spec
     version: str = "1.0"
 
-
-@dataclass(slots=True)
+    @cached_property
+    def resources_by_name(self) -> dict[str, MCPResource]:
+        """Resources keyed by name, built once per specification."""
+        return {resource.name: resource for resource in self.resources}
+
+    @cached_property
+    def resources_by_path(self) -> dict[str, MCPResource]:
+        """Resources keyed by URI and by every "/"-separated suffix of it."""
+        index: dict[str, MCPResource] = {}
+        for resource in self.resources:
+            uri = resource.uri
+            index.setdefault(uri, resource)
+            separator = uri.find("/")
+            while separator != -1:
+                index.setdefault(uri[separator + 1 :], resource)
+                separator = uri.find("/", separator + 1)
+        return index
+
+
+@dataclass(slots=True, frozen=True)
 class ResolvedTool:
     """Tool with conflict resolution applied."""
 
@@ -74,12 +93,8 @@ class ResolvedTool:
     repository: str
     branch: str
     specification: MCPTool
-    related_resources: list[MCPResource] = None  # Resources associated with this tool
-
-    def __post_init__(self) -> None:
-        """Initialize related_resources if None."""
-        if self.related_resources is None:
-            self.related_resources = []
+    # Resources associated with this tool
+    related_resources: list[MCPResource] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -6,6 +6,7 @@ from ..config.models import GitLabRepository
 from ..utils.logging import get_logger
 from .models import (
     ConflictResolutionStrategy,
+    MCPResource,
     MCPTool,
     ResolvedTool,
     ToolConflict,
@@ -124,9 +125,8 @@ class ToolResolver:
         # Find related resources based on resourceRefs
         related_resources: list[MCPResource] = []
         if tool.resourceRefs:
-            # Create a lookup map for resources by name
-            resource_map = {resource.name: resource for resource in spec.resources}
-            
+            resource_map = spec.resources_by_name
+
             # Add referenced resources that exist
             for resource_ref in tool.resourceRefs:
                 if resource_ref in resource_map:
@@ -159,8 +159,7 @@ class ToolResolver:
 
         for repo, tool in repo_tools_list:
             # Create prefix from repository URL (last part)
-            repo_prefix = repo.url.split("/")[-1]
-            resolved_name = f"{repo_prefix}_{tool.name}"
+            resolved_name = f"{repo.short_name}_{tool.name}"
             spec = repo_specs[repo]
 
             resolved_tool = self._create_resolved_tool(repo, tool, resolved_name, spec)
@@ -226,18 +225,19 @@ class ToolResolver:
             name=base_tool.name,
             description=merged_description,
             inputSchema=base_tool.inputSchema,  # Use first tool's schema
-            resourceRefs=all_resource_refs if all_resource_refs else None,
+            resourceRefs=tuple(all_resource_refs) if all_resource_refs else None,
         )
 
         # Collect resources from all repositories for merge
         all_resources: list[MCPResource] = []
         for repo, tool in repo_tools_list:
-            spec = repo_specs[repo]
             if tool.resourceRefs:
-                resource_map = {resource.name: resource for resource in spec.resources}
-                for resource_ref in tool.resourceRefs:
-                    if resource_ref in resource_map:
-                        all_resources.append(resource_map[resource_ref])
+                resource_map = repo_specs[repo].resources_by_name
+                all_resources.extend(
+                    resource_map[resource_ref]
+                    for resource_ref in tool.resourceRefs
+                    if resource_ref in resource_map
+                )
 
         # Create resolved tool
         resolved_tool = ResolvedTool(
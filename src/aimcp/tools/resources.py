@@ -1,7 +1,5 @@
 """Resource URI scheme handler for AIMCP."""
 
-from urllib.parse import urlparse
-
 from ..utils.logging import get_logger
 
 logger = get_logger("tools.resources")
@@ -15,6 +13,7 @@ class ResourceURIHandler:
     """Handles aimcp:// resource URI scheme."""
 
     SCHEME = "aimcp"
+    _PREFIX = f"{SCHEME}://"
 
     @classmethod
     def parse_uri(cls, uri: str) -> tuple[str, str, str]:
@@ -29,38 +28,39 @@ class ResourceURIHandler:
         Raises:
             ResourceURIError: If URI format is invalid
         """
-        if not uri.startswith(f"{cls.SCHEME}://"):
-            raise ResourceURIError(f"Invalid URI scheme: {uri}")
-
-        try:
-            parsed = urlparse(uri)
-
-            if parsed.scheme != cls.SCHEME:
-                raise ResourceURIError(
-                    f"Expected scheme '{cls.SCHEME}', got '{parsed.scheme}'"
-                )
+        parts = cls._split(uri)
+        if parts is not None:
+            return parts
 
-            # Extract repository from netloc (host part)
-            repository = parsed.netloc
-            if not repository:
-                raise ResourceURIError("Missing repository in URI")
+        # Work out what is wrong with the URI for the error message
+        if not uri.startswith(cls._PREFIX):
+            raise ResourceURIError(f"Invalid URI scheme: {uri}")
 
-            # Extract branch and file path from path
-            path_parts = parsed.path.lstrip("/").split("/", 1)
-            if len(path_parts) < 2:
-                raise ResourceURIError("URI must include branch and file path")
+        # Repository is everything up to the first "/" after the scheme
+        repository, _, path = uri[len(cls._PREFIX) :].partition("/")
+        if not repository:
+            raise ResourceURIError("Missing repository in URI")
 
-            branch, file_path = path_parts
+        # Extract branch and file path from path
+        branch, separator, _ = path.lstrip("/").partition("/")
+        if not separator:
+            raise ResourceURIError("URI must include branch and file path")
 
-            if not branch:
-                raise ResourceURIError("Missing branch in URI")
-            if not file_path:
-                raise ResourceURIError("Missing file path in URI")
+        if not branch:
+            raise ResourceURIError("Missing branch in URI")
+        raise ResourceURIError("Missing file path in URI")
 
-            return repository, branch, file_path
+    @classmethod
+    def _split(cls, uri: str) -> tuple[str, str, str] | None:
+        """Split a URI into its parts, or return None if it is not valid."""
+        if not uri.startswith(cls._PREFIX):
+            return None
 
-        except ValueError as e:
-            raise ResourceURIError(f"Invalid URI format: {uri}") from e
+        repository, _, path = uri[len(cls._PREFIX) :].partition("/")
+        branch, _, file_path = path.lstrip("/").partition("/")
+        if not repository or not branch or not file_path:
+            return None
+        return repository, branch, file_path
 
     @classmethod
     def build_uri(cls, repository: str, branch: str, file_path: str) -> str:
@@ -75,11 +75,10 @@ class ResourceURIHandler:
             Complete resource URI
         """
         # Clean up components
-        repository = repository.strip("/")
-        branch = branch.strip("/")
-        file_path = file_path.strip("/")
-
-        return f"{cls.SCHEME}://{repository}/{branch}/{file_path}"
+        return (
+            f"{cls._PREFIX}{repository.strip('/')}/{branch.strip('/')}/"
+            f"{file_path.strip('/')}"
+        )
 
     @classmethod
     def validate_uri(cls, uri: str) -> bool:
@@ -91,11 +90,7 @@ class ResourceURIHandler:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            cls.parse_uri(uri)
-            return True
-        except ResourceURIError:
-            return False
+        return cls._split(uri) is not None
 
     @classmethod
     def is_aimcp_uri(cls, uri: str) -> bool:
@@ -107,4 +102,4 @@ class ResourceURIHandler:
         Returns:
             True if it's an aimcp:// URI, False otherwise
         """
-        return uri.startswith(f"{cls.SCHEME}://")
+        return uri.startswith(cls._PREFIX)
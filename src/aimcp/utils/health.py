@@ -1,6 +1,7 @@
 """Health check utilities for monitoring system status."""
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
 from typing import Protocol
@@ -21,7 +22,7 @@ class HealthStatus(StrEnum):
     UNHEALTHY = "unhealthy"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class HealthCheckResult:
     """Result of a health check."""
 
@@ -29,14 +30,10 @@ class HealthCheckResult:
     status: HealthStatus
     message: str
     details: dict[str, str | int | bool] | None = None
-    checked_at: datetime | None = None
-
-    def __post_init__(self) -> None:
-        if self.checked_at is None:
-            self.checked_at = datetime.now()
+    checked_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SystemHealth:
     """Overall system health status."""
 
@@ -47,10 +44,11 @@ class SystemHealth:
     @classmethod
     def from_checks(cls, checks: list[HealthCheckResult]) -> "SystemHealth":
         """Create system health from individual check results."""
-        # Determine overall status
-        if any(check.status == HealthStatus.UNHEALTHY for check in checks):
+        # Determine overall status from a single pass over the checks
+        statuses = {check.status for check in checks}
+        if HealthStatus.UNHEALTHY in statuses:
             overall_status = HealthStatus.UNHEALTHY
-        elif any(check.status == HealthStatus.DEGRADED for check in checks):
+        elif HealthStatus.DEGRADED in statuses:
             overall_status = HealthStatus.DEGRADED
         else:
             overall_status = HealthStatus.HEALTHY
@@ -81,54 +79,64 @@ class GitLabHealthChecker:
         """Check GitLab connectivity and repository access."""
         try:
             # Test basic connection
-            async with self.gitlab_client:
-                connection_result = await self.gitlab_client.test_connection()
+            connection_result = await self.gitlab_client.test_connection()
 
-                if connection_result["status"] != "success":
-                    return HealthCheckResult(
-                        component="gitlab",
-                        status=HealthStatus.UNHEALTHY,
-                        message=f"GitLab connection failed: {connection_result['error']}",
-                    )
+            if connection_result["status"] != "success":
+                return HealthCheckResult(
+                    component="gitlab",
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"GitLab connection failed: {connection_result['error']}",
+                )
 
-                # Test repository access
-                accessible_repos = 0
-                total_repos = len(self.repositories)
-
-                for repo in self.repositories:
-                    try:
-                        await self.gitlab_client.get_project(repo.url)
-                        accessible_repos += 1
-                    except Exception as e:
-                        logger.warning(
-                            "Repository check failed", repository=repo.url, error=str(e)
-                        )
-
-                if accessible_repos == 0:
-                    status = HealthStatus.UNHEALTHY
-                    message = "No repositories accessible"
-                elif accessible_repos < total_repos:
-                    status = HealthStatus.DEGRADED
-                    message = (
-                        f"Only {accessible_repos}/{total_repos} repositories accessible"
+            # Test repository access, bounded by the client's concurrency limit
+            semaphore = asyncio.Semaphore(self.gitlab_client.config.concurrency)
+
+            async def check_repository(repo: GitLabRepository) -> None:
+                async with semaphore:
+                    await self.gitlab_client.get_project(repo.url)
+
+            total_repos = len(self.repositories)
+            results = await asyncio.gather(
+                *(check_repository(repo) for repo in self.repositories),
+                return_exceptions=True,
+            )
+
+            accessible_repos = 0
+            for repo, result in zip(self.repositories, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "Repository check failed",
+                        repository=repo.url,
+                        error=str(result),
                     )
                 else:
-                    status = HealthStatus.HEALTHY
-                    message = "All repositories accessible"
-
-                return HealthCheckResult(
-                    component="gitlab",
-                    status=status,
-                    message=message,
-                    details={
-                        "user": connection_result.get("user", "unknown"),
-                        "gitlab_version": connection_result.get(
-                            "gitlab_version", "unknown"
-                        ),
-                        "accessible_repos": accessible_repos,
-                        "total_repos": total_repos,
-                    },
+                    accessible_repos += 1
+
+            if accessible_repos == 0:
+                status = HealthStatus.UNHEALTHY
+                message = "No repositories accessible"
+            elif accessible_repos < total_repos:
+                status = HealthStatus.DEGRADED
+                message = (
+                    f"Only {accessible_repos}/{total_repos} repositories accessible"
                 )
+            else:
+                status = HealthStatus.HEALTHY
+                message = "All repositories accessible"
+
+            return HealthCheckResult(
+                component="gitlab",
+                status=status,
+                message=message,
+                details={
+                    "user": connection_result.get("user", "unknown"),
+                    "gitlab_version": connection_result.get(
+                        "gitlab_version", "unknown"
+                    ),
+                    "accessible_repos": accessible_repos,
+                    "total_repos": total_repos,
+                },
+            )
 
         except Exception as e:
             logger.error("GitLab health check failed", error=str(e))
@@ -148,43 +156,38 @@ class CacheHealthChecker:
     async def check_health(self) -> HealthCheckResult:
         """Check cache system health and performance."""
         try:
-            async with self.cache_manager:
-                stats = await self.cache_manager.get_stats()
-
-                # Determine status based on cache performance
-                if stats.item_count == 0:
-                    status = HealthStatus.DEGRADED
-                    message = "Cache is empty"
-                elif stats.hit_rate < 0.5:
-                    status = HealthStatus.DEGRADED
-                    message = f"Low cache hit rate: {stats.hit_rate:.2%}"
-                else:
-                    status = HealthStatus.HEALTHY
-                    message = f"Cache performing well (hit rate: {stats.hit_rate:.2%})"
-
-                details: dict[str, str | int | bool] = {
-                    "item_count": stats.item_count,
-                    "hit_rate": f"{stats.hit_rate:.2%}",
-                    "hit_count": stats.hit_count,
-                    "miss_count": stats.miss_count,
-                }
-
-                if stats.memory_usage_bytes:
-                    details["memory_usage_mb"] = (
-                        f"{stats.memory_usage_bytes / 1024 / 1024:.2f}"
-                    )
-
-                if stats.storage_usage_bytes:
-                    details["storage_usage_mb"] = (
-                        f"{stats.storage_usage_bytes / 1024 / 1024:.2f}"
-                    )
+            stats = await self.cache_manager.get_stats()
+
+            # Determine status based on cache performance
+            if stats.item_count == 0:
+                status = HealthStatus.DEGRADED
+                message = "Cache is empty"
+            elif stats.hit_rate < 0.5:
+                status = HealthStatus.DEGRADED
+                message = f"Low cache hit rate: {stats.hit_rate:.2%}"
+            else:
+                status = HealthStatus.HEALTHY
+                message = f"Cache performing well (hit rate: {stats.hit_rate:.2%})"
+
+            details: dict[str, str | int | bool] = {
+                "item_count": stats.item_count,
+                "hit_rate": f"{stats.hit_rate:.2%}",
+                "hit_count": stats.hit_count,
+                "miss_count": stats.miss_count,
+            }
+
+            if stats.memory_usage_bytes:
+                details["memory_usage_mb"] = f"{stats.memory_usage_mb:.2f}"
+
+            if stats.storage_usage_bytes:
+                details["storage_usage_mb"] = f"{stats.storage_usage_mb:.2f}"
 
-                return HealthCheckResult(
-                    component="cache",
-                    status=status,
-                    message=message,
-                    details=details,
-                )
+            return HealthCheckResult(
+                component="cache",
+                status=status,
+                message=message,
+                details=details,
+            )
 
         except Exception as e:
             logger.error("Cache health check failed", error=str(e))
@@ -205,24 +208,29 @@ class SystemHealthChecker:
         """Run all health checks and return overall system health."""
         logger.info("Running system health checks")
 
+        # Checks are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(checker.check_health() for checker in self.checkers),
+            return_exceptions=True,
+        )
+
         checks = []
-        for checker in self.checkers:
-            try:
-                result = await checker.check_health()
-                checks.append(result)
-            except Exception as e:
+        for checker, result in zip(self.checkers, results, strict=True):
+            if isinstance(result, BaseException):
                 logger.error(
                     "Health checker failed",
                     checker=type(checker).__name__,
-                    error=str(e),
+                    error=str(result),
                 )
                 checks.append(
                     HealthCheckResult(
                         component="unknown",
                         status=HealthStatus.UNHEALTHY,
-                        message=f"Health checker failed: {str(e)}",
+                        message=f"Health checker failed: {str(result)}",
                     )
                 )
+            else:
+                checks.append(result)
 
         system_health = SystemHealth.from_checks(checks)
         logger.info(
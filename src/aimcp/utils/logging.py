@@ -1,7 +1,9 @@
 """Logging configuration and utilities."""
 
+import functools
 import logging
 import sys
+from typing import Any
 
 import structlog
 from structlog.typing import FilteringBoundLogger
@@ -10,6 +12,11 @@ import orjson
 from ..config.models import LoggingConfig
 
 
+def _dumps(event_dict: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson as text for stdlib handlers."""
+    return orjson.dumps(event_dict, **kwargs).decode("utf-8")
+
+
 def setup_logging(config: LoggingConfig) -> FilteringBoundLogger | logging.Logger:
     """Set up structured logging.
 
@@ -19,9 +26,11 @@ def setup_logging(config: LoggingConfig) -> FilteringBoundLogger | logging.Logge
     Returns:
         Configured logger
     """
+    level = getattr(logging, config.level.upper())
+
     # Configure standard library logging
     logger_config = {
-        "level": getattr(logging, config.level.upper()),
+        "level": level,
         "stream": sys.stdout,
     }
 
@@ -31,19 +40,19 @@ def setup_logging(config: LoggingConfig) -> FilteringBoundLogger | logging.Logge
     logging.basicConfig(**logger_config)
 
     if config.structured:
-        # Configure structlog
+        # Configure structlog; the filtering wrapper drops calls below the
+        # configured level before any processor runs
         structlog.configure(
             processors=[
-                structlog.stdlib.filter_by_level,
                 structlog.stdlib.add_logger_name,
                 structlog.stdlib.add_log_level,
                 structlog.stdlib.PositionalArgumentsFormatter(),
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer(serializer=orjson.dumps),
+                structlog.processors.JSONRenderer(serializer=_dumps),
             ],
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
             logger_factory=structlog.stdlib.LoggerFactory(),
             context_class=dict,
             cache_logger_on_first_use=True,
@@ -56,6 +65,7 @@ def setup_logging(config: LoggingConfig) -> FilteringBoundLogger | logging.Logge
         return logger
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str | None = None) -> FilteringBoundLogger:
     """Get a logger instance.
 
@@ -68,3 +78,23 @@ def get_logger(name: str | None = None) -> FilteringBoundLogger:
     if name:
         return structlog.get_logger(f"aimcp.{name}")
     return structlog.get_logger("aimcp")
+
+
+def is_debug_enabled(name: str | None = None) -> bool:
+    """Check whether debug records would be emitted for a logger.
+
+    Lets hot paths skip building debug event fields that would be dropped.
+
+    Args:
+        name: Optional logger name, as passed to get_logger
+
+    Returns:
+        True if the logger is enabled for DEBUG
+    """
+    return _stdlib_logger(name).isEnabledFor(logging.DEBUG)
+
+
+@functools.lru_cache(maxsize=256)
+def _stdlib_logger(name: str | None) -> logging.Logger:
+    """Get the standard library logger behind a package logger name."""
+    return logging.getLogger(f"aimcp.{name}" if name else "aimcp")
@@ -0,0 +1,58 @@
+"""Tests for the cache manager."""
+
+from pathlib import Path
+
+from aimcp.cache.manager import CacheManager
+from aimcp.cache.storage import FileCache, MemoryCache
+from aimcp.config.models import GitLabRepository
+
+
+def _repository(branch: str = "main") -> GitLabRepository:
+    return GitLabRepository(url="group/project", branch=branch)
+
+
+async def test_tool_results_are_kept_per_repository() -> None:
+    """A tool result is only served for the repository and branch it came from."""
+    manager = CacheManager(MemoryCache())
+    await manager.set_tool_result(_repository(), "tool", {"content": "main"}, 60)
+
+    assert await manager.get_tool_result(_repository(), "tool") == {"content": "main"}
+    assert await manager.get_tool_result(_repository("dev"), "tool") is None
+
+
+async def test_invalidate_repository_drops_tool_results() -> None:
+    """Invalidating a repository drops its files and memoized tool results."""
+    manager = CacheManager(MemoryCache())
+    repository = _repository()
+    await manager.set_rule_file(repository, "rules.md", "content")
+    await manager.set_tool_result(repository, "tool", {"content": "content"}, 60)
+
+    assert await manager.invalidate_repository(repository) == 2
+    assert await manager.get_rule_file(repository, "rules.md") is None
+    assert await manager.get_tool_result(repository, "tool") is None
+
+
+async def test_repository_stats_count_only_live_files() -> None:
+    """Evicted files leave the repository index, so they are not counted."""
+    manager = CacheManager(MemoryCache(max_size=1))
+    repository = _repository()
+    await manager.set_rule_file(repository, "a.md", "a")
+    await manager.set_rule_file(repository, "b.md", "b")
+
+    assert (await manager.get_repository_stats(repository))["cached_files"] == 1
+    assert await manager.get_repository_rules(repository) == {"b.md": "b"}
+
+
+async def test_file_cache_index_drops_deleted_files(tmp_path: Path) -> None:
+    """Deleting a file entry removes its index member, also after a restart."""
+    repository = _repository()
+    manager = CacheManager(FileCache(tmp_path))
+    await manager.cache_repository_rules(repository, {"a.md": "a", "b.md": "b"})
+    await manager.cache.delete(manager._make_repository_key(repository, "a.md"))
+
+    assert (await manager.get_repository_stats(repository))["cached_files"] == 1
+
+    restarted = CacheManager(FileCache(tmp_path))
+    await restarted.cache.mdelete([restarted._make_repository_key(repository, "b.md")])
+
+    assert (await restarted.get_repository_stats(repository))["cached_files"] == 0
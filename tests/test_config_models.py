@@ -0,0 +1,85 @@
+"""Tests for configuration models."""
+
+from pathlib import Path
+
+from aimcp.config.models import AIMCPConfig, _deep_merge, _nest_overrides
+
+_CONFIG_YAML = """\
+server:
+  host: 0.0.0.0
+  port: 8000
+gitlab:
+  instance_url: https://gitlab.example.com
+  token: token
+  repositories:
+    - url: group/project
+"""
+
+
+def test_deep_merge_merges_nested_sections_without_mutating() -> None:
+    """Nested sections are merged key by key; the inputs are left untouched."""
+    base = {"server": {"host": "localhost", "port": 8000}, "cache": {"max_size": 10}}
+    override = {"server": {"port": 9000}, "tools": {"encoding": "latin-1"}}
+
+    merged = _deep_merge(base, override)
+
+    assert merged == {
+        "server": {"host": "localhost", "port": 9000},
+        "cache": {"max_size": 10},
+        "tools": {"encoding": "latin-1"},
+    }
+    assert base["server"] == {"host": "localhost", "port": 8000}
+    assert "tools" not in base
+
+
+def test_deep_merge_replaces_values_that_are_not_both_dicts() -> None:
+    """An override replaces a section outright unless both sides are dicts."""
+    assert _deep_merge({"server": {"port": 8000}}, {"server": None}) == {"server": None}
+    assert _deep_merge({"port": 8000}, {"port": {"value": 9000}}) == {
+        "port": {"value": 9000}
+    }
+
+
+def test_nest_overrides_moves_flat_server_keys_into_the_server_section() -> None:
+    """Flat CLI host/port/transport keys join any nested server overrides."""
+    overrides = {
+        "host": "0.0.0.0",
+        "port": 9000,
+        "server": {"name": "custom"},
+        "cache": {"max_size": 10},
+    }
+
+    assert _nest_overrides(overrides) == {
+        "server": {"name": "custom", "host": "0.0.0.0", "port": 9000},
+        "cache": {"max_size": 10},
+    }
+    assert _nest_overrides({"cache": {"max_size": 10}}) == {"cache": {"max_size": 10}}
+
+
+def test_yaml_overrides_only_replace_the_given_server_keys(tmp_path: Path) -> None:
+    """A port override keeps the host from the configuration file."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(_CONFIG_YAML)
+
+    config = AIMCPConfig.from_yaml_file(config_path, {"port": 9000})
+
+    assert config.server.host == "0.0.0.0"
+    assert config.server.port == 9000
+
+
+def test_trusted_load_matches_validated_load(tmp_path: Path) -> None:
+    """Skipping validation yields the same configuration as validating."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        _CONFIG_YAML.replace("token: token", "token: ' token '").replace(
+            "url: group/project", "url: /group/project/"
+        )
+        + "cache:\n  backend: file\n  storage_path: /tmp/aimcp\n"
+        + "logging:\n  level: DEBUG\n"
+    )
+
+    trusted = AIMCPConfig.from_trusted_yaml_file(config_path)
+
+    assert trusted == AIMCPConfig.from_yaml_file(config_path)
+    assert str(trusted.gitlab.instance_url) == "https://gitlab.example.com/"
+    assert trusted.gitlab.token == "token"
@@ -0,0 +1,132 @@
+"""Tests for the GitLab API client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from aimcp.config.models import GitLabConfig
+from aimcp.gitlab.client import GitLabClient, GitLabClientError
+
+
+def _client(handler: httpx.MockTransport) -> GitLabClient:
+    client = GitLabClient(
+        GitLabConfig(
+            instance_url="https://gitlab.example.com",
+            token="token",
+            repositories=[{"url": "group/project"}],
+            max_retries=0,
+        )
+    )
+    client.client = httpx.AsyncClient(transport=handler)
+    return client
+
+
+async def test_raw_file_is_revalidated_with_its_etag() -> None:
+    """A 304 reply to the remembered ETag serves the remembered bytes."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"content", headers={"ETag": '"v1"'})
+
+    client = _client(httpx.MockTransport(handler))
+    first = await client.get_file_raw("group/project", "tools.json", "main")
+    second = await client.get_file_raw("group/project", "tools.json", "main")
+
+    assert first == second == b"content"
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def _tree_pages(
+    requested: list[str],
+) -> httpx.MockTransport:
+    """Serve a two-page tree listing linked with a rel="next" header."""
+    next_url = (
+        "https://gitlab.example.com/api/v4/projects/group%2Fproject"
+        "/repository/tree?page=2"
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = request.url.params.get("page", "1")
+        requested.append(page)
+        entry = {
+            "id": page,
+            "name": f"{page}.md",
+            "path": f"rules/{page}.md",
+            "type": "blob",
+            "mode": "100644",
+        }
+        headers = {"Link": f'<{next_url}>; rel="next"'} if page == "1" else {}
+        return httpx.Response(200, json=[entry], headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+async def test_tree_listing_follows_next_page_links() -> None:
+    """Every linked page of a tree listing is returned, in order."""
+    requested: list[str] = []
+    client = _client(_tree_pages(requested))
+
+    tree = await client.get_tree("group/project", "main", recursive=True)
+
+    assert [entry.path for entry in tree] == ["rules/1.md", "rules/2.md"]
+    assert requested == ["1", "2"]
+
+
+async def test_next_tree_page_is_requested_before_the_current_one_is_used() -> None:
+    """The next page downloads while the caller works on the current one."""
+    requested: list[str] = []
+    client = _client(_tree_pages(requested))
+
+    seen: list[tuple[str, list[str]]] = []
+    async for page in client._iter_tree_pages(
+        "group/project", "main", "", recursive=True
+    ):
+        # Give the prefetch a chance to run before looking at the requests
+        for _ in range(20):
+            await asyncio.sleep(0)
+        seen.append((",".join(requested), [entry["path"] for entry in page]))
+
+    assert seen == [("1,2", ["rules/1.md"]), ("1,2", ["rules/2.md"])]
+
+
+
+async def test_literal_lookup_falls_back_to_get_without_head_metadata() -> None:
+    """A HEAD reply stripped of X-Gitlab-* headers is completed with a GET."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        return httpx.Response(
+            200,
+            json={
+                "file_name": "tools.json",
+                "file_path": "tools.json",
+                "size": 12,
+                "encoding": "base64",
+                "ref": "main",
+                "blob_id": "blob",
+                "commit_id": "commit",
+                "last_commit_id": "last",
+                "content": "",
+            },
+        )
+
+    client = _client(httpx.MockTransport(handler))
+    files = await client.find_files_by_pattern("group/project", ["tools.json"])
+
+    assert [(f.path, f.id, f.size) for f in files] == [("tools.json", "blob", 12)]
+
+
+@pytest.mark.parametrize("body", [b"<html>Bad Gateway</html>", b"[]", b'{"data": []}'])
+async def test_batch_probe_wraps_malformed_graphql_replies(body: bytes) -> None:
+    """Undecodable or oddly shaped GraphQL replies surface as client errors."""
+    client = _client(httpx.MockTransport(lambda _: httpx.Response(200, content=body)))
+    repositories = client.config.repositories
+
+    with pytest.raises(GitLabClientError):
+        await client.batch_probe(repositories)
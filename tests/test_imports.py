@@ -0,0 +1,41 @@
+"""Import smoke tests for every AIMCP module."""
+
+import importlib
+import pkgutil
+
+import pytest
+
+import aimcp
+
+MODULES = sorted(
+    module.name
+    for module in pkgutil.walk_packages(aimcp.__path__, prefix=f"{aimcp.__name__}.")
+)
+
+
+@pytest.mark.parametrize("module_name", MODULES)
+def test_module_imports(module_name: str) -> None:
+    """Every module imports without errors."""
+    importlib.import_module(module_name)
+
+
+def test_cli_command_modules_import() -> None:
+    """The lazily imported CLI command entry points resolve."""
+    from aimcp.cli.cache_clear import run as cache_clear_run
+    from aimcp.cli.cache_stats import run as cache_stats_run
+    from aimcp.cli.health_check import run as health_check_run
+    from aimcp.cli.serve import run as serve_run
+    from aimcp.cli.test_gitlab import run as test_gitlab_run
+    from aimcp.cli.validate_config import run as validate_config_run
+
+    assert all(
+        callable(run)
+        for run in (
+            cache_clear_run,
+            cache_stats_run,
+            health_check_run,
+            serve_run,
+            test_gitlab_run,
+            validate_config_run,
+        )
+    )
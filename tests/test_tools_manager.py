@@ -0,0 +1,40 @@
+"""Tests for the tool manager."""
+
+from aimcp.cache.manager import CacheManager
+from aimcp.cache.storage import MemoryCache
+from aimcp.config.models import AIMCPConfig, GitLabRepository
+from aimcp.gitlab.client import GitLabClient
+from aimcp.tools.manager import ToolManager
+
+
+def _manager(*repositories: GitLabRepository) -> ToolManager:
+    config = AIMCPConfig.model_validate(
+        {
+            "gitlab": {
+                "instance_url": "https://gitlab.example.com",
+                "token": "token",
+                "repositories": list(repositories),
+            }
+        }
+    )
+    return ToolManager(config, CacheManager(MemoryCache()), GitLabClient(config.gitlab))
+
+
+def test_find_repository_matches_the_url_and_branch_prefix() -> None:
+    """A URI path resolves to the repository whose url and branch it starts with."""
+    project = GitLabRepository(url="group/project", branch="main")
+    manager = _manager(GitLabRepository(url="group/other"), project)
+
+    assert manager._find_repository("group/project/main/docs/guide.md") == project
+    assert manager._find_repository("group/project/dev/docs/guide.md") is None
+    assert manager._find_repository("group/project/mainline/guide.md") is None
+
+
+def test_find_repository_prefers_the_first_configured_match() -> None:
+    """Overlapping prefixes resolve in configuration order, as a scan would."""
+    nested = GitLabRepository(url="group/project/sub", branch="main")
+    parent = GitLabRepository(url="group/project", branch="sub")
+    uri_path = "group/project/sub/main/guide.md"
+
+    assert _manager(nested, parent)._find_repository(uri_path) == nested
+    assert _manager(parent, nested)._find_repository(uri_path) == parent
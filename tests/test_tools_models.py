@@ -0,0 +1,47 @@
+"""Tests for tool specification models."""
+
+import pytest
+
+from aimcp.tools.models import MCPResource, ToolsSpecification
+
+_SPEC = ToolsSpecification(
+    resources=[
+        MCPResource(uri="docs/guide.md", name="guide"),
+        MCPResource(uri="rules/docs/guide.md", name="rules-guide"),
+        MCPResource(uri="aimcp://group/project/main/rules/style.md", name="style"),
+        MCPResource(uri="a//b.md", name="double-slash"),
+        MCPResource(uri="assets/", name="directory"),
+    ]
+)
+
+
+def _scan(spec: ToolsSpecification, file_path: str) -> MCPResource | None:
+    """Find a resource the way the access check did before the index."""
+    for resource in spec.resources:
+        if resource.uri == file_path or resource.uri.endswith(f"/{file_path}"):
+            return resource
+    return None
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "docs/guide.md",
+        "guide.md",
+        "rules/docs/guide.md",
+        "uide.md",
+        "style.md",
+        "rules/style.md",
+        "main/rules/style.md",
+        "group/project/main/rules/style.md",
+        "aimcp://group/project/main/rules/style.md",
+        "b.md",
+        "/b.md",
+        "",
+        "assets/",
+        "missing.md",
+    ],
+)
+def test_resources_by_path_matches_a_linear_scan(file_path: str) -> None:
+    """The path index finds the same resource as scanning the list in order."""
+    assert _SPEC.resources_by_path.get(file_path) is _scan(_SPEC, file_path)
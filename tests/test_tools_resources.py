@@ -0,0 +1,63 @@
+"""Tests for the aimcp:// resource URI handler."""
+
+import pytest
+
+from aimcp.tools.resources import ResourceURIError, ResourceURIHandler
+
+
+def test_parse_uri_splits_repository_branch_and_file_path() -> None:
+    """The file path keeps every segment after the branch."""
+    assert ResourceURIHandler.parse_uri("aimcp://project/main/docs/guide.md") == (
+        "project",
+        "main",
+        "docs/guide.md",
+    )
+
+
+def test_parse_uri_reverses_build_uri() -> None:
+    """A built URI parses back into its components."""
+    uri = ResourceURIHandler.build_uri("project", "main", "docs/guide.md")
+
+    assert ResourceURIHandler.parse_uri(uri) == ("project", "main", "docs/guide.md")
+
+
+@pytest.mark.parametrize(
+    ("uri", "message"),
+    [
+        ("https://project/main/guide.md", "Invalid URI scheme"),
+        ("aimcp:///main/guide.md", "Missing repository in URI"),
+        ("aimcp://project", "URI must include branch and file path"),
+        ("aimcp://project/main", "URI must include branch and file path"),
+        ("aimcp://project//guide.md", "URI must include branch and file path"),
+        ("aimcp://project/main/", "Missing file path in URI"),
+    ],
+)
+def test_parse_uri_reports_what_is_missing(uri: str, message: str) -> None:
+    """Invalid URIs are rejected with the reason they are invalid."""
+    with pytest.raises(ResourceURIError, match=message):
+        ResourceURIHandler.parse_uri(uri)
+
+
+@pytest.mark.parametrize(
+    "uri",
+    [
+        "aimcp://project/main/docs/guide.md",
+        "aimcp://project//main/guide.md",
+        "https://project/main/guide.md",
+        "aimcp:///main/guide.md",
+        "aimcp://project",
+        "aimcp://project/main",
+        "aimcp://project//guide.md",
+        "aimcp://project/main/",
+    ],
+)
+def test_validate_uri_agrees_with_parse_uri(uri: str) -> None:
+    """A URI is valid exactly when parse_uri accepts it."""
+    try:
+        ResourceURIHandler.parse_uri(uri)
+    except ResourceURIError:
+        parses = False
+    else:
+        parses = True
+
+    assert ResourceURIHandler.validate_uri(uri) is parses